@@ -6,6 +6,11 @@ from typing import Any
 
 from openai import OpenAI
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from .cognitive import CognitiveState, MinimalCommitmentPolicy, StrategyGate
 from .cognitive.strategy import StrategyDecision
 from .config import Config
@@ -13,6 +18,7 @@ from .context import ContextManager, Summarizer
 from .memory import Fact, MemoryStore, SessionSummary
 from .prompts import PromptBuilder
 from .provenance import (
+    DegradationLevel,
     GroundedAnswerGenerator,
     Observation,
     ObservationType,
@@ -21,6 +27,9 @@ from .provenance import (
 from .skills import Skill, SkillMetadata, SkillRegistry
 from .tools import ToolRegistry, create_default_registry
 
+# orjson.JSONDecodeError subclasses json.JSONDecodeError
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 class ProblemSolvingAgent:
     """Agent that solves problems using a closed-loop approach with tools.
@@ -167,7 +176,7 @@ class ProblemSolvingAgent:
         # Add user message
         self.context_manager.add_user_message(problem)
 
-        # Get tools to use
+        # Get tools to use (per-tool schemas are cached)
         tools = self._get_tools_for_current_skill()
         tools_schema = self.tool_registry.to_openai_schema(tools)
 
@@ -414,7 +423,7 @@ class ProblemSolvingAgent:
         """
         function_name = tool_call.function.name
         try:
-            arguments = json.loads(tool_call.function.arguments)
+            arguments = _json_loads(tool_call.function.arguments)
         except json.JSONDecodeError:
             arguments = {}
 
@@ -576,7 +585,7 @@ class ProblemSolvingAgent:
         )
 
         # Return formatted output if degraded, otherwise just the content
-        if grounded.degradation_level.value > 1:  # Not FULL_ANSWER
+        if grounded.degradation_level > DegradationLevel.FULL_ANSWER:
             return grounded.to_formatted_output()
 
         return grounded.content
@@ -4,8 +4,16 @@ import json
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 from .models import Fact, SessionSummary, UserPreference
 
+# Parses str or bytes; orjson.JSONDecodeError subclasses json.JSONDecodeError
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 class MemoryStore:
     """Persistent storage for agent memory.
@@ -50,7 +58,7 @@ class MemoryStore:
         # Load facts
         if self._facts_file.exists():
             try:
-                data = json.loads(self._facts_file.read_text(encoding="utf-8"))
+                data = _json_loads(self._facts_file.read_bytes())
                 self._facts = [Fact.from_dict(f) for f in data]
             except (json.JSONDecodeError, KeyError):
                 self._facts = []
@@ -58,7 +66,7 @@ class MemoryStore:
         # Load preferences
         if self._preferences_file.exists():
             try:
-                data = json.loads(self._preferences_file.read_text(encoding="utf-8"))
+                data = _json_loads(self._preferences_file.read_bytes())
                 self._preferences = {
                     p["key"]: UserPreference.from_dict(p) for p in data
                 }
@@ -199,7 +207,7 @@ class MemoryStore:
             return None
 
         try:
-            data = json.loads(filepath.read_text(encoding="utf-8"))
+            data = _json_loads(filepath.read_bytes())
             return SessionSummary.from_dict(data)
         except (json.JSONDecodeError, KeyError):
             return None
@@ -220,7 +228,7 @@ class MemoryStore:
             reverse=True,
         )[:limit]:
             try:
-                data = json.loads(filepath.read_text(encoding="utf-8"))
+                data = _json_loads(filepath.read_bytes())
                 summaries.append(SessionSummary.from_dict(data))
             except (json.JSONDecodeError, KeyError):
                 continue
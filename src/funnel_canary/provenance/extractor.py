@@ -10,6 +10,46 @@ from dataclasses import dataclass, field
 from .models import Claim, ClaimType, Observation, TransformStep
 
 
+# Patterns for identifying claim types
+_FACT_PATTERNS = [
+    r"根据.*?[,，]",          # "According to..."
+    r"搜索结果显示",            # "Search results show..."
+    r"\[观测\w+\]",           # "[Observation ID]"
+    r"数据表明",               # "Data indicates..."
+    r"结果显示",               # "Results show..."
+]
+
+_INFERENCE_PATTERNS = [
+    r"我推断",                 # "I infer..."
+    r"由此可见",               # "From this we can see..."
+    r"基于.*?推测",            # "Based on... I speculate..."
+    r"因此",                  # "Therefore..."
+    r"可以得出",               # "We can conclude..."
+]
+
+_HYPOTHESIS_PATTERNS = [
+    r"如果.*?那么",            # "If... then..."
+    r"假设",                  # "Assuming..."
+    r"可能",                  # "Possibly..."
+    r"或许",                  # "Perhaps..."
+    r"推测",                  # "Speculation..."
+]
+
+_OBSERVATION_REF_PATTERN = r"\[(\w{8})\]"  # Match [8-char-id]
+
+# Compiled once at import and shared by every ClaimExtractor instance
+_FACT_RE = re.compile("|".join(_FACT_PATTERNS))
+_INFERENCE_RE = re.compile("|".join(_INFERENCE_PATTERNS))
+_HYPOTHESIS_RE = re.compile("|".join(_HYPOTHESIS_PATTERNS))
+_OBS_REF_RE = re.compile(_OBSERVATION_REF_PATTERN)
+
+# Sentence splitting: Chinese sentence ends are mapped onto "\n" with
+# str.translate so one str.split handles every single-char delimiter;
+# English ".!?" followed by whitespace still needs a regex
+_SENTENCE_SPLIT_TABLE = str.maketrans(dict.fromkeys("。！？", "\n"))
+_EN_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+
 @dataclass
 class ExtractedClaim:
     """A claim extracted from LLM output with metadata."""
@@ -30,38 +70,11 @@ class ClaimExtractor:
     - Hypotheses and speculations
     """
 
-    # Patterns for identifying claim types
-    FACT_PATTERNS = [
-        r"根据.*?[,，]",          # "According to..."
-        r"搜索结果显示",            # "Search results show..."
-        r"\[观测\w+\]",           # "[Observation ID]"
-        r"数据表明",               # "Data indicates..."
-        r"结果显示",               # "Results show..."
-    ]
-
-    INFERENCE_PATTERNS = [
-        r"我推断",                 # "I infer..."
-        r"由此可见",               # "From this we can see..."
-        r"基于.*?推测",            # "Based on... I speculate..."
-        r"因此",                  # "Therefore..."
-        r"可以得出",               # "We can conclude..."
-    ]
-
-    HYPOTHESIS_PATTERNS = [
-        r"如果.*?那么",            # "If... then..."
-        r"假设",                  # "Assuming..."
-        r"可能",                  # "Possibly..."
-        r"或许",                  # "Perhaps..."
-        r"推测",                  # "Speculation..."
-    ]
-
-    OBSERVATION_REF_PATTERN = r"\[(\w{8})\]"  # Match [8-char-id]
-
-    def __init__(self) -> None:
-        self._fact_re = re.compile("|".join(self.FACT_PATTERNS))
-        self._inference_re = re.compile("|".join(self.INFERENCE_PATTERNS))
-        self._hypothesis_re = re.compile("|".join(self.HYPOTHESIS_PATTERNS))
-        self._obs_ref_re = re.compile(self.OBSERVATION_REF_PATTERN)
+    # Pattern sources, kept as class attributes for backward compatibility
+    FACT_PATTERNS = _FACT_PATTERNS
+    INFERENCE_PATTERNS = _INFERENCE_PATTERNS
+    HYPOTHESIS_PATTERNS = _HYPOTHESIS_PATTERNS
+    OBSERVATION_REF_PATTERN = _OBSERVATION_REF_PATTERN
 
     def extract_claims(self, text: str) -> list[ExtractedClaim]:
         """Extract claims from LLM output text.
@@ -90,14 +103,20 @@ class ClaimExtractor:
 
     def _split_into_sentences(self, text: str) -> list[str]:
         """Split text into sentences."""
-        # Split on Chinese and English punctuation
-        sentences = re.split(r'[。！？\n]|(?<=[.!?])\s+', text)
-        return [s.strip() for s in sentences if s.strip()]
+        # Split on Chinese punctuation and newlines via a translation table,
+        # then only run the regex on parts that may hold English sentence ends
+        sentences = []
+        for part in text.translate(_SENTENCE_SPLIT_TABLE).split("\n"):
+            if "." in part or "!" in part or "?" in part:
+                sentences.extend(_EN_SENTENCE_END_RE.split(part))
+            else:
+                sentences.append(part)
+        return [s for s in (s.strip() for s in sentences) if s]
 
     def _analyze_sentence(self, sentence: str) -> ExtractedClaim | None:
         """Analyze a sentence to extract claim information."""
         # Extract observation references
-        obs_refs = self._obs_ref_re.findall(sentence)
+        obs_refs = _OBS_REF_RE.findall(sentence)
 
         # Determine claim type based on patterns
         claim_type = self._determine_claim_type(sentence, obs_refs)
@@ -123,15 +142,15 @@ class ClaimExtractor:
     ) -> ClaimType:
         """Determine the type of claim based on content."""
         # If has observation references and fact patterns, it's a fact
-        if obs_refs and self._fact_re.search(sentence):
+        if obs_refs and _FACT_RE.search(sentence):
             return ClaimType.FACT
 
         # Check for inference patterns
-        if self._inference_re.search(sentence):
+        if _INFERENCE_RE.search(sentence):
             return ClaimType.INFERENCE
 
         # Check for hypothesis patterns
-        if self._hypothesis_re.search(sentence):
+        if _HYPOTHESIS_RE.search(sentence):
             return ClaimType.HYPOTHESIS
 
         # Default to inference if has some obs refs but no clear patterns
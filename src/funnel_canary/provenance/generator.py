@@ -5,6 +5,7 @@ based on the four axioms of the anti-hallucination system.
 """
 
 from dataclasses import dataclass, field
+import time
 
 from .models import (
     Claim,
@@ -21,7 +22,7 @@ class GroundedAnswer:
 
     content: str                            # The answer content
     degradation_level: DegradationLevel     # How much the answer was degraded
-    observations_used: list[str] = field(default_factory=list)  # Observation IDs
+    observations_used: tuple[str, ...] = field(default_factory=tuple)  # Observation IDs
     claims: list[Claim] = field(default_factory=list)  # Claims in the answer
     high_confidence_parts: list[str] = field(default_factory=list)
     medium_confidence_parts: list[str] = field(default_factory=list)
@@ -145,17 +146,24 @@ class GroundedAnswerGenerator:
         claims = claims or []
         degradation_level = self.determine_degradation(registry)
 
-        # Get all valid observations
-        valid_obs = registry.get_valid_observations()
-        observations_used = [obs.id for obs in valid_obs]
+        # Get all valid observations (one clock snapshot for all expiry checks)
+        now = time.time()
+        valid_obs = registry.get_valid_observations(current_time=now)
+        observations_used = tuple(obs.id for obs in valid_obs)
 
-        # Categorize claims by confidence
-        high_conf = []
-        medium_conf = []
-        low_conf = []
+        # Categorize claims by confidence. Full answers never display the
+        # confidence breakdown, so skip the refresh/categorization there.
+        high_conf: list[str] = []
+        medium_conf: list[str] = []
+        low_conf: list[str] = []
 
-        for claim in claims:
-            claim.update_confidence(registry.observations)
+        if degradation_level == DegradationLevel.FULL_ANSWER:
+            claims_to_categorize: list[Claim] = []
+        else:
+            claims_to_categorize = claims
+
+        for claim in claims_to_categorize:
+            claim.update_confidence(registry.observations, current_time=now)
             if claim.confidence >= 0.8:
                 high_conf.append(claim.statement[:100])
             elif claim.confidence >= 0.5:
@@ -164,7 +172,7 @@ class GroundedAnswerGenerator:
                 low_conf.append(claim.statement[:100])
 
         # Generate limitations
-        limitations = self._generate_limitations(registry, valid_obs)
+        limitations = self._generate_limitations(registry, valid_obs, now)
 
         # Generate suggested actions based on degradation level
         suggested_actions = self._generate_suggestions(degradation_level, registry)
@@ -217,28 +225,44 @@ class GroundedAnswerGenerator:
         self,
         registry: ProvenanceRegistry,
         valid_obs: list[Observation],
+        current_time: float | None = None,
     ) -> list[str]:
         """Generate limitation notes."""
         limitations = []
 
-        # Check for time-sensitive data
+        # Single pass: find the first soon-to-expire source and whether
+        # observations come from more than one source
+        expiring_source: str | None = None
+        first_source: str | None = None
+        multi_source = False
         for obs in valid_obs:
-            if obs.ttl_seconds:
-                remaining = obs.remaining_ttl()
+            if expiring_source is None and obs.ttl_seconds:
+                remaining = obs.remaining_ttl(current_time)
                 if remaining is not None and remaining < 1800:  # Less than 30 min
-                    limitations.append(
-                        f"部分数据（来自{obs.source_id}）即将过期，建议重新获取"
-                    )
-                    break
+                    expiring_source = obs.source_id
+
+            if not multi_source:
+                if first_source is None:
+                    first_source = obs.source_id
+                elif obs.source_id != first_source:
+                    multi_source = True
+
+            if multi_source and expiring_source is not None:
+                break
+
+        # Check for time-sensitive data
+        if expiring_source is not None:
+            limitations.append(
+                f"部分数据（来自{expiring_source}）即将过期，建议重新获取"
+            )
 
         # Check for expired data
-        expired = registry.invalidate_expired()
+        expired = registry.invalidate_expired(current_time)
         if expired:
             limitations.append(f"有 {len(expired)} 条观测数据已过期")
 
         # Check observation coverage
-        obs_sources = set(obs.source_id for obs in valid_obs)
-        if len(obs_sources) == 1:
+        if first_source is not None and not multi_source:
             limitations.append("信息仅来自单一来源，建议交叉验证")
 
         return limitations
@@ -278,8 +302,9 @@ class GroundedAnswerGenerator:
         Returns:
             Formatted provenance summary string.
         """
-        valid_obs = registry.get_valid_observations()
-        expired_ids = registry.invalidate_expired()
+        now = time.time()
+        valid_obs = registry.get_valid_observations(current_time=now)
+        expired_ids = registry.invalidate_expired(now)
 
         lines = ["【观测数据摘要】"]
 
@@ -7,19 +7,41 @@ Implements the four axioms of the anti-hallucination system:
 - Axiom D: Any unverifiable part must be explicitly degraded
 """
 
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum, auto
-from typing import Any
-import uuid
+from enum import Enum, IntEnum
+import heapq
+import json
+from itertools import count
+from secrets import token_hex
+import time
+from typing import Any, Iterable
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
-class ObservationType(Enum):
+# Source of observation-set version tags. Shared by all registries so a tag
+# never identifies two different observation sets.
+_observation_versions = count()
+
+
+class ObservationType(IntEnum):
     """Types of authoritative observations (Axiom B)."""
 
-    TOOL_RETURN = auto()    # Tool/API returns - confidence 100%
-    USER_INPUT = auto()     # User statements - confidence 80%
-    DEFINED_RULE = auto()   # System rules - formally verifiable
+    TOOL_RETURN = 1     # Tool/API returns - confidence 100%
+    USER_INPUT = 2      # User statements - confidence 80%
+    DEFINED_RULE = 3    # System rules - formally verifiable
+
+
+# Display labels used by Observation.to_context
+_SOURCE_LABELS = {
+    ObservationType.TOOL_RETURN: "工具返回",
+    ObservationType.USER_INPUT: "用户输入",
+    ObservationType.DEFINED_RULE: "系统规则",
+}
 
 
 class ClaimType(Enum):
@@ -30,16 +52,19 @@ class ClaimType(Enum):
     HYPOTHESIS = "hypothesis"  # Speculative, low evidence
 
 
-class DegradationLevel(Enum):
-    """Degradation levels for outputs (Axiom D implementation)."""
+class DegradationLevel(IntEnum):
+    """Degradation levels for outputs (Axiom D implementation).
 
-    FULL_ANSWER = auto()           # High confidence, complete answer
-    PARTIAL_WITH_UNCERTAINTY = auto()  # Medium confidence, with uncertainty note
-    REQUEST_MORE_INFO = auto()     # Low confidence, request more observations
-    REFUSE = auto()                # Insufficient info, refuse to answer
+    Ordered from least to most degraded, so levels compare as integers.
+    """
+
+    FULL_ANSWER = 1                # High confidence, complete answer
+    PARTIAL_WITH_UNCERTAINTY = 2   # Medium confidence, with uncertainty note
+    REQUEST_MORE_INFO = 3          # Low confidence, request more observations
+    REFUSE = 4                     # Insufficient info, refuse to answer
 
 
-@dataclass
+@dataclass(slots=True)
 class TransformStep:
     """A single step in the reasoning chain (Axiom C implementation).
 
@@ -71,19 +96,21 @@ class TransformStep:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Observation:
     """An authoritative observation from the world (Axiom A & B implementation).
 
     Represents a piece of information that has been observed from a trusted source.
-    All facts must ultimately trace back to observations.
+    All facts must ultimately trace back to observations. Once added to a
+    ProvenanceRegistry, edit it through ``ProvenanceRegistry.update_observation``
+    so the registry's caches stay in sync.
     """
 
-    id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    id: str = field(default_factory=lambda: token_hex(4))
     content: str = ""                           # Observation content
     source_type: ObservationType = ObservationType.TOOL_RETURN
     source_id: str = ""                         # Tool name / user ID / rule ID
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: float = field(default_factory=time.time)  # Epoch seconds
     confidence: float = 1.0                     # Confidence [0.0, 1.0]
     scope: str = ""                             # Applicable scope
     ttl_seconds: int | None = None              # Time-to-live (None = never expires)
@@ -94,23 +121,38 @@ class Observation:
         if self.confidence == 1.0 and self.source_type == ObservationType.USER_INPUT:
             self.confidence = 0.8
 
-    def is_expired(self, current_time: datetime | None = None) -> bool:
-        """Check if observation has expired based on TTL."""
+    @property
+    def timestamp_dt(self) -> datetime:
+        """Get the observation time as a local datetime."""
+        return datetime.fromtimestamp(self.timestamp)
+
+    def is_expired(self, current_time: float | None = None) -> bool:
+        """Check if observation has expired based on TTL.
+
+        Args:
+            current_time: Epoch seconds to check against (defaults to now).
+        """
         if self.ttl_seconds is None:
             return False
 
-        current_time = current_time or datetime.now()
-        age_seconds = (current_time - self.timestamp).total_seconds()
-        return age_seconds > self.ttl_seconds
+        if current_time is None:
+            current_time = time.time()
+        return current_time - self.timestamp > self.ttl_seconds
+
+    def expires_at(self) -> float | None:
+        """Get the epoch time after which the observation is expired."""
+        if self.ttl_seconds is None:
+            return None
+        return self.timestamp + self.ttl_seconds
 
-    def remaining_ttl(self, current_time: datetime | None = None) -> int | None:
+    def remaining_ttl(self, current_time: float | None = None) -> int | None:
         """Get remaining TTL in seconds, or None if never expires."""
         if self.ttl_seconds is None:
             return None
 
-        current_time = current_time or datetime.now()
-        age_seconds = (current_time - self.timestamp).total_seconds()
-        remaining = self.ttl_seconds - int(age_seconds)
+        if current_time is None:
+            current_time = time.time()
+        remaining = self.ttl_seconds - int(current_time - self.timestamp)
         return max(0, remaining)
 
     def to_dict(self) -> dict[str, Any]:
@@ -120,7 +162,7 @@ class Observation:
             "content": self.content,
             "source_type": self.source_type.name,
             "source_id": self.source_id,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp_dt.isoformat(),
             "confidence": self.confidence,
             "scope": self.scope,
             "ttl_seconds": self.ttl_seconds,
@@ -132,15 +174,15 @@ class Observation:
         """Create from dictionary."""
         timestamp = data.get("timestamp")
         if isinstance(timestamp, str):
-            timestamp = datetime.fromisoformat(timestamp)
+            timestamp = datetime.fromisoformat(timestamp).timestamp()
         else:
-            timestamp = datetime.now()
+            timestamp = time.time()
 
         source_type_str = data.get("source_type", "TOOL_RETURN")
         source_type = ObservationType[source_type_str]
 
         return cls(
-            id=data.get("id", str(uuid.uuid4())[:8]),
+            id=data["id"] if "id" in data else token_hex(4),
             content=data.get("content", ""),
             source_type=source_type,
             source_id=data.get("source_id", ""),
@@ -151,27 +193,25 @@ class Observation:
             metadata=data.get("metadata", {}),
         )
 
-    def to_context(self) -> str:
+    def to_context(self, current_time: float | None = None) -> str:
         """Generate context string for prompt injection."""
-        source_label = {
-            ObservationType.TOOL_RETURN: "工具返回",
-            ObservationType.USER_INPUT: "用户输入",
-            ObservationType.DEFINED_RULE: "系统规则",
-        }.get(self.source_type, "未知来源")
+        source_label = _SOURCE_LABELS.get(self.source_type, "未知来源")
 
-        lines = [f"[{self.id}] 来源: {source_label} ({self.source_id})"]
-        lines.append(f"    内容: {self.content[:200]}...")
-        lines.append(f"    置信度: {self.confidence:.0%}")
+        lines = [
+            f"[{self.id}] 来源: {source_label} ({self.source_id})",
+            f"    内容: {self.content[:200]}...",
+            f"    置信度: {self.confidence:.0%}",
+        ]
 
         if self.ttl_seconds:
-            remaining = self.remaining_ttl()
+            remaining = self.remaining_ttl(current_time)
             if remaining is not None:
                 lines.append(f"    剩余有效期: {remaining}秒")
 
         return "\n".join(lines)
 
 
-@dataclass
+@dataclass(slots=True)
 class Claim:
     """A claim derived from observations (Axiom C implementation).
 
@@ -179,16 +219,28 @@ class Claim:
     through a chain of transformations.
     """
 
-    id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    id: str = field(default_factory=lambda: token_hex(4))
     statement: str = ""                         # The claim content
     claim_type: ClaimType = ClaimType.FACT
     source_observations: list[str] = field(default_factory=list)  # Observation IDs
     transform_chain: list[TransformStep] = field(default_factory=list)
     confidence: float = 1.0                     # Computed confidence
     scope: str = ""                             # Applicable scope
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: float = field(default_factory=time.time)  # Epoch seconds
+    _confidence_version: int = field(
+        default=-1, init=False, repr=False, compare=False
+    )
+
+    @property
+    def created_at_dt(self) -> datetime:
+        """Get the creation time as a local datetime."""
+        return datetime.fromtimestamp(self.created_at)
 
-    def compute_confidence(self, observations: dict[str, "Observation"]) -> float:
+    def compute_confidence(
+        self,
+        observations: dict[str, "Observation"],
+        current_time: float | None = None,
+    ) -> float:
         """Compute confidence based on source observations and transforms.
 
         Confidence is calculated as:
@@ -199,20 +251,28 @@ class Claim:
         if not self.source_observations:
             return 0.0
 
-        # Get minimum confidence from source observations
-        obs_confidences = []
-        for obs_id in self.source_observations:
-            if obs_id in observations:
-                obs = observations[obs_id]
-                if not obs.is_expired():
-                    obs_confidences.append(obs.confidence)
-
-        if not obs_confidences:
+        if current_time is None:
+            current_time = time.time()
+
+        # Fast path: single source, no transforms
+        if len(self.source_observations) == 1 and not self.transform_chain:
+            obs = observations.get(self.source_observations[0])
+            if obs is None or obs.is_expired(current_time):
+                return 0.0
+            return max(0.0, min(1.0, obs.confidence))
+
+        # Start with minimum confidence of valid source observations (conservative)
+        base_confidence = min(
+            (
+                obs.confidence
+                for obs in map(observations.get, self.source_observations)
+                if obs is not None and not obs.is_expired(current_time)
+            ),
+            default=None,
+        )
+        if base_confidence is None:
             return 0.0
 
-        # Start with minimum (conservative)
-        base_confidence = min(obs_confidences)
-
         # Apply transform deltas
         for step in self.transform_chain:
             base_confidence += step.confidence_delta
@@ -220,9 +280,25 @@ class Claim:
         # Clamp to valid range
         return max(0.0, min(1.0, base_confidence))
 
-    def update_confidence(self, observations: dict[str, "Observation"]) -> None:
-        """Update the confidence based on current observations."""
-        self.confidence = self.compute_confidence(observations)
+    def update_confidence(
+        self,
+        observations: dict[str, "Observation"],
+        version: int | None = None,
+        current_time: float | None = None,
+    ) -> None:
+        """Update the confidence based on current observations.
+
+        Args:
+            observations: Observations to compute confidence from.
+            version: Optional version tag of ``observations`` (see
+                ProvenanceRegistry). The recompute is skipped when the
+                confidence was already computed for this version.
+            current_time: Epoch seconds to evaluate observation expiry at.
+        """
+        if version is not None and version == self._confidence_version:
+            return
+        self.confidence = self.compute_confidence(observations, current_time)
+        self._confidence_version = -1 if version is None else version
 
     def get_audit_trail(self) -> str:
         """Generate human-readable audit trail (Axiom C)."""
@@ -253,7 +329,7 @@ class Claim:
             "transform_chain": [t.to_dict() for t in self.transform_chain],
             "confidence": self.confidence,
             "scope": self.scope,
-            "created_at": self.created_at.isoformat(),
+            "created_at": self.created_at_dt.isoformat(),
         }
 
     @classmethod
@@ -261,9 +337,9 @@ class Claim:
         """Create from dictionary."""
         created_at = data.get("created_at")
         if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at)
+            created_at = datetime.fromisoformat(created_at).timestamp()
         else:
-            created_at = datetime.now()
+            created_at = time.time()
 
         claim_type_str = data.get("claim_type", "fact")
         claim_type = ClaimType(claim_type_str)
@@ -273,7 +349,7 @@ class Claim:
         ]
 
         return cls(
-            id=data.get("id", str(uuid.uuid4())[:8]),
+            id=data["id"] if "id" in data else token_hex(4),
             statement=data.get("statement", ""),
             claim_type=claim_type,
             source_observations=data.get("source_observations", []),
@@ -294,6 +370,19 @@ class ProvenanceRegistry:
     def __init__(self) -> None:
         self.observations: dict[str, Observation] = {}
         self.claims: dict[str, Claim] = {}
+        # Version tag of the valid observation set, used to memoize claim
+        # confidence. Changes on add/update/clear and when an observation
+        # expires.
+        self._obs_version = next(_observation_versions)
+        self._next_expiry: float | None = None
+        # Earliest TTL deadline of any stored observation (recomputed after an
+        # update); before it nothing can be expired
+        self._earliest_expiry: float | None = None
+        # Secondary indexes for grouped lookups
+        self._by_source: defaultdict[str, list[Observation]] = defaultdict(list)
+        self._by_type: defaultdict[ObservationType, list[Observation]] = defaultdict(list)
+        # (version, count, confidence sum) of the valid observation set
+        self._confidence_stats: tuple[int, int, float] | None = None
 
     def add_observation(self, observation: Observation) -> str:
         """Add an observation to the registry.
@@ -301,8 +390,110 @@ class ProvenanceRegistry:
         Returns:
             The observation ID.
         """
-        self.observations[observation.id] = observation
-        return observation.id
+        return self.add_observations((observation,))[0]
+
+    def add_observations(self, observations: Iterable[Observation]) -> list[str]:
+        """Add several observations at once.
+
+        Indexes are updated per observation, but the version tag and expiry
+        deadlines are updated once for the whole batch.
+
+        Returns:
+            The observation IDs, in input order.
+        """
+        ids = []
+        earliest: float | None = None
+        for observation in observations:
+            previous = self.observations.get(observation.id)
+            if previous is not None:
+                self._by_source[previous.source_id].remove(previous)
+                self._by_type[previous.source_type].remove(previous)
+
+            self.observations[observation.id] = observation
+            self._by_source[observation.source_id].append(observation)
+            self._by_type[observation.source_type].append(observation)
+            expires_at = observation.expires_at()
+            if expires_at is not None and (earliest is None or expires_at < earliest):
+                earliest = expires_at
+            ids.append(observation.id)
+
+        if not ids:
+            return ids
+        self._obs_version = next(_observation_versions)
+        if earliest is not None:
+            if self._next_expiry is None or earliest < self._next_expiry:
+                self._next_expiry = earliest
+            if self._earliest_expiry is None or earliest < self._earliest_expiry:
+                self._earliest_expiry = earliest
+        return ids
+
+    def update_observation(self, obs_id: str, **changes: Any) -> Observation:
+        """Edit a registered observation in place.
+
+        Registered observations must be edited through this method rather than
+        by assigning fields directly, so that the source and type indexes,
+        expiry deadlines and memoized confidences are refreshed.
+
+        Args:
+            obs_id: ID of the observation to edit.
+            **changes: Field values to assign, e.g. ``confidence=0.5``.
+
+        Returns:
+            The edited observation.
+
+        Raises:
+            KeyError: If no observation with ``obs_id`` is registered.
+            ValueError: If the changes include ``id``.
+        """
+        if "id" in changes:
+            raise ValueError("Observation id cannot be changed once registered")
+        observation = self.observations[obs_id]
+        source_id, source_type = observation.source_id, observation.source_type
+        for name, value in changes.items():
+            setattr(observation, name, value)
+
+        if observation.source_id != source_id:
+            self._by_source[source_id].remove(observation)
+            self._by_source[observation.source_id].append(observation)
+        if observation.source_type != source_type:
+            self._by_type[source_type].remove(observation)
+            self._by_type[observation.source_type].append(observation)
+
+        self._obs_version = next(_observation_versions)
+        if "timestamp" in changes or "ttl_seconds" in changes:
+            deadlines = [
+                expires_at for expires_at in (
+                    obs.expires_at() for obs in self.observations.values()
+                )
+                if expires_at is not None
+            ]
+            self._earliest_expiry = self._next_expiry = min(deadlines, default=None)
+        return observation
+
+    def _may_have_expired(self, current_time: float) -> bool:
+        """Check whether any observation can be expired at ``current_time``.
+
+        Lets bulk scans skip per-observation TTL checks in the common case
+        where no deadline has been reached yet.
+        """
+        return self._earliest_expiry is not None and current_time > self._earliest_expiry
+
+    def _current_version(self, current_time: float) -> int:
+        """Get the observation version tag as of ``current_time``.
+
+        Bumps the version once the earliest pending TTL deadline has passed,
+        so memoized claim confidences never outlive an expired observation.
+        """
+        if self._next_expiry is not None and current_time > self._next_expiry:
+            self._obs_version = next(_observation_versions)
+            pending = [
+                expires_at for expires_at in (
+                    obs.expires_at() for obs in self.observations.values()
+                )
+                if expires_at is not None and expires_at >= current_time
+            ]
+            self._next_expiry = min(pending) if pending else None
+        return self._obs_version
 
     def add_claim(self, claim: Claim) -> str:
         """Add a claim to the registry.
@@ -312,7 +503,10 @@ class ProvenanceRegistry:
         Returns:
             The claim ID.
         """
-        claim.update_confidence(self.observations)
+        now = time.time()
+        claim.update_confidence(
+            self.observations, self._current_version(now), now
+        )
         self.claims[claim.id] = claim
         return claim.id
 
@@ -327,38 +521,97 @@ class ProvenanceRegistry:
     def get_valid_observations(
         self,
         min_confidence: float = 0.0,
-        current_time: datetime | None = None
+        current_time: float | None = None
     ) -> list[Observation]:
         """Get all valid (non-expired) observations above confidence threshold."""
-        current_time = current_time or datetime.now()
+        if current_time is None:
+            current_time = time.time()
+        if not self._may_have_expired(current_time):
+            return [
+                obs for obs in self.observations.values()
+                if obs.confidence >= min_confidence
+            ]
         return [
             obs for obs in self.observations.values()
             if not obs.is_expired(current_time) and obs.confidence >= min_confidence
         ]
 
+    def _valid_confidence_stats(self, current_time: float) -> tuple[int, float]:
+        """Get the count and confidence sum of valid observations.
+
+        Memoized on the observation version tag, so repeated degradation
+        checks only rescan the registry after an add, clear or expiry.
+        """
+        version = self._current_version(current_time)
+        stats = self._confidence_stats
+        if stats is None or stats[0] != version:
+            valid_obs = self.get_valid_observations(current_time=current_time)
+            stats = (version, len(valid_obs), sum(o.confidence for o in valid_obs))
+            self._confidence_stats = stats
+        return stats[1], stats[2]
+
+    def _partition_observations(
+        self,
+        current_time: float
+    ) -> tuple[list[Observation], int]:
+        """Split observations into valid ones and a count of expired ones."""
+        if not self._may_have_expired(current_time):
+            return list(self.observations.values()), 0
+
+        valid = []
+        expired_count = 0
+        for obs in self.observations.values():
+            if obs.is_expired(current_time):
+                expired_count += 1
+            else:
+                valid.append(obs)
+        return valid, expired_count
+
     def get_valid_claims(
         self,
         min_confidence: float = 0.0,
-        claim_type: ClaimType | None = None
+        claim_type: ClaimType | None = None,
+        current_time: float | None = None,
+        refresh: bool = False,
     ) -> list[Claim]:
-        """Get all claims above confidence threshold, optionally filtered by type."""
+        """Get all claims above confidence threshold, optionally filtered by type.
+
+        Args:
+            min_confidence: Minimum claim confidence to include.
+            claim_type: Only include claims of this type, if given.
+            current_time: Epoch seconds to evaluate observation expiry at.
+            refresh: Recompute each claim's confidence against the current
+                observations before filtering. By default the stored
+                confidence is used and claims are left untouched.
+        """
+        if refresh:
+            if current_time is None:
+                current_time = time.time()
+            version = self._current_version(current_time)
+            for claim in self.claims.values():
+                # No-op for claims already computed at this version
+                claim.update_confidence(self.observations, version, current_time)
+
         claims = []
         for claim in self.claims.values():
-            # Refresh confidence before filtering
-            claim.update_confidence(self.observations)
-
             if claim.confidence >= min_confidence:
                 if claim_type is None or claim.claim_type == claim_type:
                     claims.append(claim)
 
         return claims
 
-    def invalidate_expired(self) -> list[str]:
+    def invalidate_expired(
+        self,
+        current_time: float | None = None
+    ) -> list[str]:
         """Mark expired observations and return their IDs.
 
         Note: Does not delete, just identifies expired items for reference.
         """
-        current_time = datetime.now()
+        if current_time is None:
+            current_time = time.time()
+        if not self._may_have_expired(current_time):
+            return []
         expired_ids = [
             obs_id for obs_id, obs in self.observations.items()
             if obs.is_expired(current_time)
@@ -375,20 +628,14 @@ class ProvenanceRegistry:
 
     def get_observations_by_source(self, source_id: str) -> list[Observation]:
         """Get all observations from a specific source."""
-        return [
-            obs for obs in self.observations.values()
-            if obs.source_id == source_id
-        ]
+        return list(self._by_source.get(source_id, ()))
 
     def get_observations_by_type(
         self,
         source_type: ObservationType
     ) -> list[Observation]:
         """Get all observations of a specific type."""
-        return [
-            obs for obs in self.observations.values()
-            if obs.source_type == source_type
-        ]
+        return list(self._by_type.get(source_type, ()))
 
     def determine_degradation_level(
         self,
@@ -403,14 +650,13 @@ class ProvenanceRegistry:
         - has observations but confidence < 0.5 → REQUEST_MORE_INFO
         - no valid observations → REFUSE
         """
-        valid_obs = self.get_valid_observations(min_confidence=0.0)
+        obs_count, confidence_sum = self._valid_confidence_stats(time.time())
 
-        if not valid_obs:
+        if not obs_count:
             return DegradationLevel.REFUSE
 
         # Calculate average confidence of valid observations
-        avg_confidence = sum(o.confidence for o in valid_obs) / len(valid_obs)
-        obs_count = len(valid_obs)
+        avg_confidence = confidence_sum / obs_count
 
         if avg_confidence >= 0.8 and obs_count >= required_observations:
             return DegradationLevel.FULL_ANSWER
@@ -426,24 +672,25 @@ class ProvenanceRegistry:
 
         Includes recent valid observations for the LLM to reference.
         """
-        valid_obs = self.get_valid_observations()
+        # Snapshot the clock once and classify observations in one pass
+        now = time.time()
+        valid_obs, expired_count = self._partition_observations(now)
 
         if not valid_obs:
             return "【无有效观测数据】"
 
-        # Sort by timestamp (most recent first) and limit
-        sorted_obs = sorted(
+        # Most recent first, limited (bounded heap instead of a full sort)
+        sorted_obs = heapq.nlargest(
+            max_observations,
             valid_obs,
             key=lambda o: o.timestamp,
-            reverse=True
-        )[:max_observations]
+        )
 
         lines = ["【当前观测数据】"]
         for obs in sorted_obs:
-            lines.append(obs.to_context())
+            lines.append(obs.to_context(now))
 
         # Add summary
-        expired_count = len(self.invalidate_expired())
         if expired_count > 0:
             lines.append(f"\n（已过期观测: {expired_count} 条）")
 
@@ -453,6 +700,11 @@ class ProvenanceRegistry:
         """Clear all observations and claims."""
         self.observations.clear()
         self.claims.clear()
+        self._by_source.clear()
+        self._by_type.clear()
+        self._obs_version = next(_observation_versions)
+        self._next_expiry = None
+        self._earliest_expiry = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert registry to dictionary for serialization."""
@@ -470,12 +722,31 @@ class ProvenanceRegistry:
         """Create registry from dictionary."""
         registry = cls()
 
-        for obs_data in data.get("observations", {}).values():
-            obs = Observation.from_dict(obs_data)
-            registry.observations[obs.id] = obs
+        registry.add_observations(
+            Observation.from_dict(obs_data)
+            for obs_data in data.get("observations", {}).values()
+        )
 
         for claim_data in data.get("claims", {}).values():
             claim = Claim.from_dict(claim_data)
             registry.claims[claim.id] = claim
 
         return registry
+
+    def to_json(self) -> str:
+        """Serialize the registry to a compact JSON string.
+
+        Uses orjson when it is installed, otherwise the standard library.
+        """
+        if orjson is not None:
+            return orjson.dumps(
+                self.to_dict(), option=orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> "ProvenanceRegistry":
+        """Create registry from a JSON string produced by ``to_json``."""
+        if orjson is not None:
+            return cls.from_dict(orjson.loads(data))
+        return cls.from_dict(json.loads(data))
@@ -1,14 +1,27 @@
 """YAML/Markdown loader for skill definitions."""
 
-import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from .models import Skill, SkillMetadata, SkillTriggers
 
 
+def _skip_marker_line(content: str, pos: int) -> int:
+    """Return the index just past the whitespace ending a ``---`` marker line.
+
+    Mirrors the ``---\\s*\\n`` frontmatter rule: the whitespace after the
+    marker must contain a newline, and everything up to the last newline in
+    that whitespace run is consumed. Returns -1 if there is no such newline.
+    """
+    rest = content[pos:]
+    whitespace_len = len(rest) - len(rest.lstrip())
+    newline = rest.rfind("\n", 0, whitespace_len)
+    if newline == -1:
+        return -1
+    return pos + newline + 1
+
+
 def parse_skill_file(content: str) -> tuple[dict[str, Any], str]:
     """Parse a SKILL.md file with YAML frontmatter.
 
@@ -19,24 +32,56 @@ def parse_skill_file(content: str) -> tuple[dict[str, Any], str]:
         Tuple of (frontmatter dict, markdown content).
     """
     # Match YAML frontmatter between --- markers
-    pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)$'
-    match = re.match(pattern, content, re.DOTALL)
-
-    if not match:
+    if not content.startswith("---"):
         # No frontmatter, treat entire content as markdown
         return {}, content
 
-    yaml_content = match.group(1)
-    markdown_content = match.group(2)
+    yaml_start = _skip_marker_line(content, 3)
+    if yaml_start == -1:
+        return {}, content
+
+    # Find the closing "---" line (trailing whitespace allowed)
+    close = content.find("\n---", yaml_start)
+    while close != -1:
+        markdown_start = _skip_marker_line(content, close + 4)
+        if markdown_start != -1:
+            break
+        close = content.find("\n---", close + 1)
+
+    if close == -1:
+        return {}, content
+
+    yaml_content = content[yaml_start:close]
+    markdown_content = content[markdown_start:]
+
+    # Imported lazily so importing the skill package doesn't load PyYAML
+    import yaml
 
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     try:
-        frontmatter = yaml.safe_load(yaml_content) or {}
+        frontmatter = yaml.load(yaml_content, Loader=loader) or {}
     except yaml.YAMLError:
         frontmatter = {}
 
     return frontmatter, markdown_content
 
 
+@lru_cache(maxsize=512)
+def _parse_skill_path(path: str, mtime_ns: int) -> tuple[dict[str, Any], str]:
+    """Read and parse a skill file, cached per (path, modification time).
+
+    The returned frontmatter is shared between callers and must not be mutated.
+    """
+    content = Path(path).read_text(encoding="utf-8")
+    return parse_skill_file(content)
+
+
+def _read_skill_file(skill_path: Path) -> tuple[dict[str, Any], str]:
+    """Parse a skill file, reusing the cached result while it is unchanged."""
+    return _parse_skill_path(str(skill_path), skill_path.stat().st_mtime_ns)
+
+
 def load_skill_metadata(skill_path: Path) -> SkillMetadata | None:
     """Load skill metadata from a SKILL.md file.
 
@@ -49,8 +94,7 @@ def load_skill_metadata(skill_path: Path) -> SkillMetadata | None:
         SkillMetadata or None if parsing fails.
     """
     try:
-        content = skill_path.read_text(encoding="utf-8")
-        frontmatter, _ = parse_skill_file(content)
+        frontmatter, _ = _read_skill_file(skill_path)
 
         if not frontmatter:
             return None
@@ -58,16 +102,16 @@ def load_skill_metadata(skill_path: Path) -> SkillMetadata | None:
         # Parse triggers
         triggers_data = frontmatter.get("triggers", {})
         triggers = SkillTriggers(
-            keywords=triggers_data.get("keywords", []),
+            keywords=list(triggers_data.get("keywords", [])),
         )
 
         return SkillMetadata(
             name=frontmatter.get("name", skill_path.parent.name),
             description=frontmatter.get("description", ""),
             version=frontmatter.get("version", "1.0"),
-            tools=frontmatter.get("tools", []),
+            tools=list(frontmatter.get("tools", [])),
             triggers=triggers,
-            resources=frontmatter.get("resources", []),
+            resources=list(frontmatter.get("resources", [])),
             path=str(skill_path),
         )
 
@@ -85,8 +129,7 @@ def load_full_skill(skill_path: Path) -> Skill | None:
         Skill or None if loading fails.
     """
     try:
-        content = skill_path.read_text(encoding="utf-8")
-        frontmatter, markdown_content = parse_skill_file(content)
+        frontmatter, markdown_content = _read_skill_file(skill_path)
 
         if not frontmatter:
             return None
@@ -94,16 +137,16 @@ def load_full_skill(skill_path: Path) -> Skill | None:
         # Load metadata
         triggers_data = frontmatter.get("triggers", {})
         triggers = SkillTriggers(
-            keywords=triggers_data.get("keywords", []),
+            keywords=list(triggers_data.get("keywords", [])),
         )
 
         metadata = SkillMetadata(
             name=frontmatter.get("name", skill_path.parent.name),
             description=frontmatter.get("description", ""),
             version=frontmatter.get("version", "1.0"),
-            tools=frontmatter.get("tools", []),
+            tools=list(frontmatter.get("tools", [])),
             triggers=triggers,
-            resources=frontmatter.get("resources", []),
+            resources=list(frontmatter.get("resources", [])),
             path=str(skill_path),
         )
 
@@ -3,11 +3,18 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillTriggers:
     """Triggers that can activate a skill."""
 
     keywords: list[str] = field(default_factory=list)
+    _keywords_lower: tuple[str, ...] = field(
+        init=False, repr=False, compare=False, default=()
+    )
+
+    def __post_init__(self) -> None:
+        """Lowercase keywords once instead of on every match."""
+        self._keywords_lower = tuple(kw.lower() for kw in self.keywords)
 
     def matches(self, text: str) -> bool:
         """Check if text matches any trigger keyword.
@@ -19,10 +26,10 @@ class SkillTriggers:
             True if any keyword is found in text.
         """
         text_lower = text.lower()
-        return any(kw.lower() in text_lower for kw in self.keywords)
+        return any(kw in text_lower for kw in self._keywords_lower)
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillMetadata:
     """Metadata for a skill (loaded at startup).
 
@@ -49,7 +56,7 @@ class SkillMetadata:
         return self.triggers.matches(problem)
 
 
-@dataclass
+@dataclass(slots=True)
 class Skill:
     """Full skill with metadata and content.
 
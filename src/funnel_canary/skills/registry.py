@@ -1,10 +1,14 @@
 """Skill registry for discovery and management."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .loader import load_full_skill, load_skill_metadata
 from .models import Skill, SkillMetadata
 
+# Upper bound on threads used to load skill files during discovery
+_MAX_DISCOVERY_WORKERS = 16
+
 
 class SkillRegistry:
     """Registry for discovering and loading skills.
@@ -44,6 +48,7 @@ class SkillRegistry:
         if not self._skills_dir.exists():
             return []
 
+        skill_files = []
         for skill_dir in self._skills_dir.iterdir():
             if not skill_dir.is_dir():
                 continue
@@ -52,9 +57,17 @@ class SkillRegistry:
             if not skill_file.exists():
                 continue
 
-            metadata = load_skill_metadata(skill_file)
-            if metadata:
-                self._metadata_cache[metadata.name] = metadata
+            skill_files.append(skill_file)
+
+        if not skill_files:
+            return []
+
+        # Load in parallel; map() keeps directory order for match priority
+        max_workers = min(_MAX_DISCOVERY_WORKERS, len(skill_files))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for metadata in executor.map(load_skill_metadata, skill_files):
+                if metadata:
+                    self._metadata_cache[metadata.name] = metadata
 
         return list(self._metadata_cache.values())
 
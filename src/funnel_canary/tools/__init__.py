@@ -8,6 +8,8 @@ This module provides a registry-based tool system with:
 - Provenance tracking via ToolResult
 """
 
+from functools import lru_cache
+
 from .base import Tool, ToolMetadata, ToolParameter, ToolResult, tool
 from .categories import COMPUTE_TOOLS, FILESYSTEM_TOOLS, INTERACTION_TOOLS, WEB_TOOLS
 from .registry import ExecutionResult, ToolRegistry
@@ -16,21 +18,27 @@ from .registry import ExecutionResult, ToolRegistry
 def create_default_registry() -> ToolRegistry:
     """Create a registry with all default tools.
 
+    The default registry is built once; each call returns an independent
+    copy so callers can register extra tools without affecting others.
+
     Returns:
         ToolRegistry with all built-in tools registered.
     """
+    return _default_registry().copy()
+
+
+@lru_cache(maxsize=1)
+def _default_registry() -> ToolRegistry:
+    """Build the shared default registry and its OpenAI schema list."""
     registry = ToolRegistry()
 
     # Register all category tools
-    for tool_instance in WEB_TOOLS:
-        registry.register(tool_instance)
-    for tool_instance in INTERACTION_TOOLS:
-        registry.register(tool_instance)
-    for tool_instance in COMPUTE_TOOLS:
-        registry.register(tool_instance)
-    for tool_instance in FILESYSTEM_TOOLS:
-        registry.register(tool_instance)
+    registry.register_many(
+        [*WEB_TOOLS, *INTERACTION_TOOLS, *COMPUTE_TOOLS, *FILESYSTEM_TOOLS]
+    )
 
+    # Materialize the schema list once so copies inherit it
+    registry.openai_tools
     return registry
 
 
@@ -1,14 +1,14 @@
 """Base classes for the tool system."""
 
 from dataclasses import dataclass, field
-from datetime import datetime
+import time
 from typing import Any, Callable, Protocol
 
 from ..cognitive.safety import ToolRisk
 from ..provenance import Observation, ObservationType
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolParameter:
     """Definition of a tool parameter."""
 
@@ -16,9 +16,10 @@ class ToolParameter:
     type: str
     description: str
     required: bool = True
+    items: dict[str, Any] | None = None  # Element schema for "array" params
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """Result of a tool execution with provenance information.
 
@@ -45,7 +46,7 @@ class ToolResult:
             content=content[:500],  # Limit stored content
             source_type=ObservationType.TOOL_RETURN,
             source_id=tool_name,
-            timestamp=datetime.now(),
+            timestamp=time.time(),
             confidence=confidence,
             scope=scope,
             ttl_seconds=ttl_seconds,
@@ -64,7 +65,7 @@ class ToolResult:
             content=f"工具执行失败: {error_message}",
             source_type=ObservationType.TOOL_RETURN,
             source_id=tool_name,
-            timestamp=datetime.now(),
+            timestamp=time.time(),
             confidence=0.0,  # No confidence in failed result
             scope="error",
             metadata={"error": error_message},
@@ -77,7 +78,7 @@ class ToolResult:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolMetadata:
     """Metadata describing a tool."""
 
@@ -87,9 +88,21 @@ class ToolMetadata:
     parameters: list[ToolParameter] = field(default_factory=list)
     skill_bindings: list[str] = field(default_factory=list)
     risk_level: ToolRisk = ToolRisk.SAFE
+    _schema_cache: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_openai_schema(self) -> dict[str, Any]:
-        """Convert to OpenAI function calling schema."""
+        """Convert to OpenAI function calling schema.
+
+        The schema is built on first use and reused afterwards; treat the
+        returned dict as read-only.
+        """
+        if self._schema_cache is None:
+            self._schema_cache = self._build_openai_schema()
+        return self._schema_cache
+
+    def _build_openai_schema(self) -> dict[str, Any]:
         properties = {}
         required = []
 
@@ -98,6 +111,8 @@ class ToolMetadata:
                 "type": param.type,
                 "description": param.description,
             }
+            if param.items is not None:
+                properties[param.name]["items"] = param.items
             if param.required:
                 required.append(param.name)
 
@@ -126,7 +141,7 @@ class ToolExecutor(Protocol):
     def __call__(self, **kwargs: Any) -> str | ToolResult: ...
 
 
-@dataclass
+@dataclass(slots=True)
 class Tool:
     """A complete tool with metadata and executor."""
 
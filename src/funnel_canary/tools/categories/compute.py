@@ -3,14 +3,27 @@
 Includes Python sandbox execution and shell command execution (Agent SDK compatible).
 """
 
+import atexit
 import contextlib
 import datetime
-import io
 import json
 import math
+import multiprocessing
+import re
+import shutil
+import signal
 import subprocess
+import threading
+from multiprocessing.connection import wait
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
 from ..base import Tool, ToolMetadata, ToolParameter, ToolResult
 from ...cognitive.safety import ToolRisk
 
@@ -18,79 +31,316 @@ from ...cognitive.safety import ToolRisk
 # Python execution results don't expire (deterministic)
 PYTHON_EXEC_TTL = None
 
+# Limits for each python_exec run in the worker process
+PYTHON_EXEC_TIMEOUT = 5                        # Wall-clock seconds
+PYTHON_EXEC_CPU_LIMIT = 2                      # CPU seconds
+PYTHON_EXEC_MEMORY_LIMIT = 512 * 1024 * 1024   # Address space in bytes
+
+# Warm worker processes kept between calls, and tasks served before recycling
+PYTHON_EXEC_IDLE_WORKERS = 2
+PYTHON_EXEC_TASKS_PER_WORKER = 100
+
+# Modules that sandboxed code may import
+_SAFE_IMPORTS = MappingProxyType({
+    "math": math,
+    "datetime": datetime,
+    "json": json,
+    "re": re,
+})
+
+
+def _safe_import(name, globals=None, locals=None, fromlist=(), level=0):
+    """__import__ replacement that only hands out whitelisted modules."""
+    module = _SAFE_IMPORTS.get(name) if level == 0 else None
+    if module is None:
+        raise ImportError(f"不允许导入模块: {name}")
+    return module
+
+
+# Sandbox namespaces, built once at import. Each run gets its own copies
+# (the interpreter requires a real dict for __builtins__ when importing), so
+# executed code cannot leak changes into later calls.
+_SAFE_BUILTINS = MappingProxyType({
+    "abs": abs,
+    "all": all,
+    "any": any,
+    "bool": bool,
+    "dict": dict,
+    "enumerate": enumerate,
+    "filter": filter,
+    "float": float,
+    "int": int,
+    "len": len,
+    "list": list,
+    "map": map,
+    "max": max,
+    "min": min,
+    "pow": pow,
+    "print": print,
+    "range": range,
+    "reversed": reversed,
+    "round": round,
+    "set": set,
+    "sorted": sorted,
+    "str": str,
+    "sum": sum,
+    "tuple": tuple,
+    "zip": zip,
+    "__import__": _safe_import,
+})
+
+_BASE_GLOBALS = MappingProxyType({
+    # Allow importing safe modules
+    "math": math,
+    "datetime": datetime,
+    "json": json,
+})
 
-def _python_exec(code: str) -> ToolResult:
-    """Execute Python code in a sandboxed environment.
 
-    Args:
-        code: Python code to execute.
+class _ListSink:
+    """Minimal stdout replacement that collects writes in a list."""
+
+    def __init__(self) -> None:
+        self.parts: list[str] = []
+
+    def write(self, text: str) -> int:
+        self.parts.append(text)
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+# Sources longer than this are compiled on every call instead of cached
+_COMPILE_CACHE_MAX_CHARS = 16_384
+
+
+@lru_cache(maxsize=256)
+def _compile_cached(code: str):
+    return compile(code, "<string>", "exec")
+
+
+def _compile_code(code: str):
+    """Compile user code, reusing code objects for repeated snippets."""
+    if len(code) < _COMPILE_CACHE_MAX_CHARS:
+        return _compile_cached(code)
+    return compile(code, "<string>", "exec")
+
+
+def _apply_task_limits(cpu_seconds: int, memory_bytes: int) -> None:
+    """Cap CPU time and memory for the next task in this worker process."""
+    if resource is None:
+        return
+
+    # RLIMIT_CPU counts the whole process lifetime, so extend the soft limit
+    # from the CPU time already used by earlier tasks
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    cpu_limit = int(usage.ru_utime + usage.ru_stime) + cpu_seconds + 1
+    _, cpu_hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if cpu_hard == resource.RLIM_INFINITY or cpu_limit <= cpu_hard:
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_limit, cpu_hard))
+
+    _, mem_hard = resource.getrlimit(resource.RLIMIT_AS)
+    if mem_hard == resource.RLIM_INFINITY or memory_bytes <= mem_hard:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, mem_hard))
+
+
+def _new_globals() -> dict[str, Any]:
+    """Fresh globals for one sandboxed run."""
+    safe_globals = dict(_BASE_GLOBALS)
+    safe_globals["__builtins__"] = dict(_SAFE_BUILTINS)
+    return safe_globals
+
+
+def _memory_limit_error(memory_bytes: int) -> str:
+    return f"超出内存限制 ({memory_bytes // (1024 * 1024)} MB)"
+
+
+def _run_sandboxed(
+    code: str, cpu_seconds: int, memory_bytes: int
+) -> tuple[bool, str]:
+    """Execute code inside the worker process.
 
     Returns:
-        ToolResult with execution output and provenance information.
+        Tuple of (succeeded, captured stdout or error description).
     """
-    tool_name = "python_exec"
+    _apply_task_limits(cpu_seconds, memory_bytes)
+    stdout_capture = _ListSink()
+    try:
+        with contextlib.redirect_stdout(stdout_capture):
+            exec(_compile_code(code), _new_globals())
+    except MemoryError:
+        return False, f"MemoryError: {_memory_limit_error(memory_bytes)}"
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+    return True, "".join(stdout_capture.parts)
 
-    safe_builtins = {
-        "abs": abs,
-        "all": all,
-        "any": any,
-        "bool": bool,
-        "dict": dict,
-        "enumerate": enumerate,
-        "filter": filter,
-        "float": float,
-        "int": int,
-        "len": len,
-        "list": list,
-        "map": map,
-        "max": max,
-        "min": min,
-        "pow": pow,
-        "print": print,
-        "range": range,
-        "reversed": reversed,
-        "round": round,
-        "set": set,
-        "sorted": sorted,
-        "str": str,
-        "sum": sum,
-        "tuple": tuple,
-        "zip": zip,
-        "__import__": lambda name: __import__(name) if name in ["math", "datetime", "json", "re"] else None,
-    }
-
-    safe_globals: dict[str, Any] = {"__builtins__": safe_builtins}
 
-    # Allow importing safe modules
-    safe_globals["math"] = math
-    safe_globals["datetime"] = datetime
-    safe_globals["json"] = json
+def _worker_main(conn) -> None:
+    """Serve sandboxed runs sent over ``conn`` until the pipe closes."""
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            return
+        conn.send(_run_sandboxed(*task))
+
+
+@lru_cache(maxsize=1)
+def _exec_context():
+    start_methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context(
+        "forkserver" if "forkserver" in start_methods else "spawn"
+    )
+
 
-    # Capture stdout
-    stdout_capture = io.StringIO()
+class _ExecWorker:
+    """A sandbox process that serves one python_exec call at a time."""
 
+    def __init__(self) -> None:
+        context = _exec_context()
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, args=(child_conn,), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.tasks = 0
+
+    def kill(self) -> None:
+        self.conn.close()
+        self.process.kill()
+        self.process.join()
+
+    def close(self) -> None:
+        """Let the worker exit on its own once its pipe closes."""
+        self.conn.close()
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+
+
+# Idle warm workers. Each in-flight call owns its worker, so a timeout or a
+# crash only ever takes down the call that caused it.
+_idle_workers: list[_ExecWorker] = []
+_idle_workers_lock = threading.Lock()
+
+
+def _checkout_worker() -> _ExecWorker:
+    with _idle_workers_lock:
+        while _idle_workers:
+            worker = _idle_workers.pop()
+            if worker.process.is_alive():
+                return worker
+    return _ExecWorker()
+
+
+def _checkin_worker(worker: _ExecWorker) -> None:
+    if worker.tasks < PYTHON_EXEC_TASKS_PER_WORKER:
+        with _idle_workers_lock:
+            if len(_idle_workers) < PYTHON_EXEC_IDLE_WORKERS:
+                _idle_workers.append(worker)
+                return
+    worker.close()
+
+
+def _shutdown_exec_pool() -> None:
+    """Stop all idle workers; later calls start fresh ones."""
+    with _idle_workers_lock:
+        workers = list(_idle_workers)
+        _idle_workers.clear()
+    for worker in workers:
+        worker.close()
+
+
+atexit.register(_shutdown_exec_pool)
+
+
+def _worker_exit_error(exitcode: int | None) -> str:
+    """Describe why a worker process died mid-task."""
+    sigxcpu = getattr(signal, "SIGXCPU", None)
+    if sigxcpu is not None and exitcode == -sigxcpu:
+        return f"超出CPU时间限制 ({PYTHON_EXEC_CPU_LIMIT}秒)"
+    if exitcode is not None and exitcode < 0:
+        # Allocation failures outside Python code abort or crash the process
+        return (
+            f"工作进程被信号 {-exitcode} 终止，"
+            f"可能{_memory_limit_error(PYTHON_EXEC_MEMORY_LIMIT)}"
+        )
+    return f"工作进程异常退出 (退出码 {exitcode})"
+
+
+def _run_in_worker(code: str) -> tuple[bool, str]:
+    """Run code in a warm worker, enforcing the wall-clock timeout.
+
+    Returns:
+        Tuple of (succeeded, captured stdout or error description). Timeouts
+        and worker deaths are reported as failures naming the limit hit.
+    """
+    worker = _checkout_worker()
     try:
-        with contextlib.redirect_stdout(stdout_capture):
-            exec(code, safe_globals)
-
-        output = stdout_capture.getvalue()
-        result_content = output.strip() if output.strip() else "代码执行完成（无输出）"
-
-        return ToolResult.from_success(
-            content=result_content,
-            tool_name=tool_name,
-            confidence=1.0,  # Deterministic computation
-            ttl_seconds=PYTHON_EXEC_TTL,
-            scope="computation",
-            metadata={
-                "code_length": len(code),
-                "has_output": bool(output.strip()),
-            },
+        worker.conn.send((code, PYTHON_EXEC_CPU_LIMIT, PYTHON_EXEC_MEMORY_LIMIT))
+        ready = wait(
+            [worker.conn, worker.process.sentinel], timeout=PYTHON_EXEC_TIMEOUT
         )
+        if not ready:
+            worker.kill()
+            return False, f"执行超时 ({PYTHON_EXEC_TIMEOUT}秒)"
+        if worker.conn in ready:
+            outcome = worker.conn.recv()
+            worker.tasks += 1
+            _checkin_worker(worker)
+            return outcome
+    except (EOFError, OSError):
+        # The pipe broke because the worker died mid-task
+        pass
+    except BaseException:
+        worker.kill()
+        raise
+
+    worker.kill()
+    return False, _worker_exit_error(worker.process.exitcode)
+
 
+def _python_exec(code: str) -> ToolResult:
+    """Execute Python code in a sandboxed worker process.
+
+    The worker runs with restricted builtins plus CPU and memory limits, and
+    is killed if the code does not finish within ``PYTHON_EXEC_TIMEOUT``.
+    Each in-flight call has its own worker process.
+
+    Args:
+        code: Python code to execute.
+
+    Returns:
+        ToolResult with execution output and provenance information.
+    """
+    tool_name = "python_exec"
+
+    try:
+        succeeded, output = _run_in_worker(code)
     except Exception as e:
         return ToolResult.from_error(f"执行错误: {type(e).__name__}: {e}", tool_name)
 
+    if not succeeded:
+        return ToolResult.from_error(f"执行错误: {output}", tool_name)
+
+    output = output.strip()
+    result_content = output if output else "代码执行完成（无输出）"
+
+    return ToolResult.from_success(
+        content=result_content,
+        tool_name=tool_name,
+        confidence=1.0,  # Deterministic computation
+        ttl_seconds=PYTHON_EXEC_TTL,
+        scope="computation",
+        metadata={
+            "code_length": len(code),
+            "has_output": bool(output),
+        },
+    )
+
 
 # Tool definitions
 python_exec = Tool(
@@ -134,6 +384,11 @@ BASH_COMMAND_BLACKLIST = [
     "chmod -R 777 /",
 ]
 
+# (lowercased pattern, original pattern) pairs, lowercased once at import
+_BASH_BLACKLIST_LOWER = tuple(
+    (dangerous.lower(), dangerous) for dangerous in BASH_COMMAND_BLACKLIST
+)
+
 
 def _is_command_safe(command: str) -> tuple[bool, str | None]:
     """Check if a command is safe to execute.
@@ -146,13 +401,41 @@ def _is_command_safe(command: str) -> tuple[bool, str | None]:
     """
     command_lower = command.lower().strip()
 
-    for dangerous in BASH_COMMAND_BLACKLIST:
-        if dangerous.lower() in command_lower:
+    for dangerous_lower, dangerous in _BASH_BLACKLIST_LOWER:
+        if dangerous_lower in command_lower:
             return False, f"命令包含危险操作: {dangerous}"
 
     return True, None
 
 
+# Characters that need shell parsing (pipes, redirection, quoting, globbing,
+# expansion, assignment, command separators). Commands without any of them
+# are plain argument lists and can be run without spawning /bin/sh.
+_SHELL_METACHARS = frozenset("|&;<>()$`\\\"'*?[]{}#~=%!\n")
+_SHELL_WORD_SEPARATORS = re.compile(r"[ \t]+")
+
+
+def _split_simple_command(command: str) -> list[str] | None:
+    """Split a command into argv if it can run without a shell.
+
+    Returns:
+        Argument list, or None if the command needs the shell (metacharacters,
+        shell builtins, a program not found on PATH, or a program given by
+        path).
+    """
+    if not _SHELL_METACHARS.isdisjoint(command):
+        return None
+    # No quotes or escapes are present, so splitting on the shell's own word
+    # separators is exact. str.split() would also split on \u3000, \xa0 and
+    # other whitespace that the shell keeps inside words.
+    args = _SHELL_WORD_SEPARATORS.split(command.strip(" \t"))
+    # Programs given by path are often shebang-less scripts, which exec()
+    # rejects with ENOEXEC but the shell runs as shell scripts
+    if not args or "/" in args[0] or shutil.which(args[0]) is None:
+        return None
+    return args
+
+
 def _bash_exec(command: str, timeout: int = BASH_DEFAULT_TIMEOUT) -> ToolResult:
     """Execute a shell command.
 
@@ -177,10 +460,11 @@ def _bash_exec(command: str, timeout: int = BASH_DEFAULT_TIMEOUT) -> ToolResult:
         return ToolResult.from_error(f"安全检查失败: {error_msg}", tool_name)
 
     try:
-        # Execute command
+        # Execute command, skipping the shell for simple commands
+        args = _split_simple_command(command)
         result = subprocess.run(
-            command,
-            shell=True,
+            args if args is not None else command,
+            shell=args is None,
             capture_output=True,
             text=True,
             timeout=timeout,
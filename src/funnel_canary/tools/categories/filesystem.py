@@ -4,6 +4,16 @@ Provides file reading and searching capabilities inspired by Anthropic Agent SDK
 """
 
 import fnmatch
+import heapq
+import os
+import queue
+import re
+import stat
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 from ..base import Tool, ToolMetadata, ToolParameter, ToolResult
@@ -13,10 +23,63 @@ from ...cognitive.safety import ToolRisk
 FILE_READ_MAX = 100_000  # 100KB max file size
 GLOB_MAX_RESULTS = 100   # Maximum number of files to return
 
+# Number of file contents kept in memory by Read
+FILE_CACHE_SIZE = 128
+
+# Files modified this recently are not cached: a same-size rewrite within
+# the filesystem's timestamp granularity would keep the same cache key
+FILE_CACHE_MIN_AGE_NS = 1_000_000_000
+
+# Threads scanning directories for Glob; os.scandir releases the GIL, so
+# scans of different directories overlap their filesystem latency
+GLOB_WORKERS = min(16, (os.cpu_count() or 1) * 4)
+
+
+# Read cache: (path, mtime_ns, ctime_ns, size) -> decoded content. Editing
+# a file changes its mtime and chmod changes its ctime, so stale entries are
+# never hit and simply age out of the LRU.
+_file_cache: OrderedDict[tuple[str, int, int, int], str] = OrderedDict()
+_file_cache_lock = threading.Lock()
+
+
+def _file_cache_key(path: Path, stat_result: os.stat_result) -> tuple[str, int, int, int]:
+    return (
+        str(path),
+        stat_result.st_mtime_ns,
+        stat_result.st_ctime_ns,
+        stat_result.st_size,
+    )
+
+
+def _get_cached_file(key: tuple[str, int, int, int]) -> str | None:
+    with _file_cache_lock:
+        content = _file_cache.get(key)
+        if content is not None:
+            _file_cache.move_to_end(key)
+        return content
+
+
+def _put_cached_file(key: tuple[str, int, int, int], content: str) -> None:
+    if time.time_ns() - key[1] < FILE_CACHE_MIN_AGE_NS:
+        return
+    with _file_cache_lock:
+        _file_cache[key] = content
+        _file_cache.move_to_end(key)
+        while len(_file_cache) > FILE_CACHE_SIZE:
+            _file_cache.popitem(last=False)
+
+
+def clear_file_cache() -> None:
+    """Drop all cached file contents."""
+    with _file_cache_lock:
+        _file_cache.clear()
+
 
 def _read_file(file_path: str) -> ToolResult:
     """Read content from a local file.
 
+    Contents of unchanged files are served from an in-memory LRU cache.
+
     Args:
         file_path: Path to the file to read.
 
@@ -28,28 +91,34 @@ def _read_file(file_path: str) -> ToolResult:
     try:
         path = Path(file_path).resolve()
 
-        # Security check: file must exist
-        if not path.exists():
+        # One stat call answers existence, file type and size
+        try:
+            stat_result = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            # Security check: file must exist
             return ToolResult.from_error(f"文件不存在: {file_path}", tool_name)
 
         # Security check: must be a file, not a directory
-        if not path.is_file():
+        if not stat.S_ISREG(stat_result.st_mode):
             return ToolResult.from_error(f"路径不是文件: {file_path}", tool_name)
 
         # Check file size
-        file_size = path.stat().st_size
+        file_size = stat_result.st_size
         if file_size > FILE_READ_MAX:
             return ToolResult.from_error(
                 f"文件过大 ({file_size} bytes > {FILE_READ_MAX} bytes): {file_path}",
                 tool_name,
             )
 
-        # Read file content
-        try:
-            content = path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            # Try reading as binary and decode with fallback
+        cache_key = _file_cache_key(path, stat_result)
+        content = _get_cached_file(cache_key)
+        if content is None:
+            # Read once; invalid UTF-8 bytes become replacement characters.
+            # Newlines are normalized as read_text's universal newlines did.
             content = path.read_bytes().decode("utf-8", errors="replace")
+            if "\r" in content:
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
+            _put_cached_file(cache_key, content)
 
         return ToolResult.from_success(
             content=content,
@@ -70,6 +139,122 @@ def _read_file(file_path: str) -> ToolResult:
         return ToolResult.from_error(f"读取文件失败: {type(e).__name__}: {e}", tool_name)
 
 
+@lru_cache(maxsize=64)
+def _compile_glob(pattern: str) -> tuple[re.Pattern[str] | str | None, ...]:
+    """Split a glob pattern into one matcher per path component.
+
+    Cached, since agents tend to repeat the same few patterns.
+
+    Returns:
+        Tuple holding None for ``**``, the name itself for literal components
+        and a compiled regex for wildcard components.
+    """
+    if not pattern:
+        raise ValueError(f"Unacceptable pattern: {pattern!r}")
+    pattern_path = Path(pattern)
+    if pattern_path.is_absolute():
+        raise NotImplementedError("Non-relative patterns are unsupported")
+
+    parts: list[re.Pattern[str] | str | None] = []
+    for part in pattern_path.parts:
+        if part == "**":
+            parts.append(None)
+        elif "**" in part:
+            raise ValueError("Invalid pattern: '**' can only be an entire path component")
+        elif any(char in part for char in "*?["):
+            parts.append(re.compile(fnmatch.translate(part)))
+        else:
+            parts.append(part)
+    return tuple(parts)
+
+
+def _scan_glob_dir(
+    directory: str, parts: tuple[re.Pattern[str] | str | None, ...], index: int
+) -> tuple[list[os.DirEntry], list[tuple[str, int]]]:
+    """Match one pattern component against one directory.
+
+    Follows ``Path.glob`` semantics: ``**`` matches zero or more
+    directories without descending into symlinked ones, and unreadable
+    directories are skipped.
+
+    Returns:
+        Tuple of (matching files, (directory, component index) pairs still
+        to scan).
+    """
+    part = parts[index]
+    last = index == len(parts) - 1
+    files: list[os.DirEntry] = []
+    subdirs: list[tuple[str, int]] = []
+
+    try:
+        if part is None:
+            if not last:
+                subdirs.append((directory, index + 1))
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append((entry.path, index))
+        elif isinstance(part, str) and not last:
+            # Literal directory step, no listing needed
+            subdir = os.path.join(directory, part)
+            if os.path.isdir(subdir):
+                subdirs.append((subdir, index + 1))
+        else:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if isinstance(part, str):
+                        if entry.name != part:
+                            continue
+                    elif part.match(entry.name) is None:
+                        continue
+                    if last:
+                        if entry.is_file():
+                            files.append(entry)
+                    elif entry.is_dir():
+                        subdirs.append((entry.path, index + 1))
+    except OSError:
+        pass
+
+    return files, subdirs
+
+
+def _walk_glob(base_path: Path, pattern: str) -> list[os.DirEntry]:
+    """Find files under base_path matching pattern.
+
+    Directories are scanned concurrently by a thread pool. Each scan
+    returns the subdirectories still to visit, and the calling thread
+    submits them, so every (directory, component) pair is scanned once.
+    """
+    parts = _compile_glob(pattern)
+    matches: dict[str, os.DirEntry] = {}
+    seen: set[tuple[str, int]] = set()
+    completed: queue.SimpleQueue = queue.SimpleQueue()
+    outstanding = 0
+
+    with ThreadPoolExecutor(max_workers=GLOB_WORKERS) as executor:
+
+        def submit(directory: str, index: int) -> None:
+            nonlocal outstanding
+            if (directory, index) in seen:
+                return
+            seen.add((directory, index))
+            outstanding += 1
+            executor.submit(
+                _scan_glob_dir, directory, parts, index
+            ).add_done_callback(completed.put)
+
+        submit(str(base_path), 0)
+        while outstanding:
+            files, subdirs = completed.get().result()
+            outstanding -= 1
+            for entry in files:
+                matches.setdefault(entry.path, entry)
+            for directory, index in subdirs:
+                submit(directory, index)
+
+    return list(matches.values())
+
+
 def _glob_files(pattern: str, path: str = ".") -> ToolResult:
     """Search for files matching a glob pattern.
 
@@ -85,41 +270,35 @@ def _glob_files(pattern: str, path: str = ".") -> ToolResult:
     try:
         base_path = Path(path).resolve()
 
-        # Security check: base path must exist
-        if not base_path.exists():
+        try:
+            base_mode = os.stat(base_path).st_mode
+        except (FileNotFoundError, NotADirectoryError):
+            # Security check: base path must exist
             return ToolResult.from_error(f"路径不存在: {path}", tool_name)
 
         # Security check: must be a directory
-        if not base_path.is_dir():
+        if not stat.S_ISDIR(base_mode):
             return ToolResult.from_error(f"路径不是目录: {path}", tool_name)
 
-        # Find matching files
-        if "**" in pattern:
-            # Recursive glob
-            matches = list(base_path.glob(pattern))
-        else:
-            # Non-recursive glob
-            matches = list(base_path.glob(pattern))
-
-        # Filter to only files (not directories)
-        file_matches = [m for m in matches if m.is_file()]
-
-        # Sort by modification time (newest first)
-        file_matches.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-
-        # Limit results
-        truncated = len(file_matches) > GLOB_MAX_RESULTS
-        if truncated:
-            file_matches = file_matches[:GLOB_MAX_RESULTS]
+        # Find matching files (directories are never returned)
+        file_matches = _walk_glob(base_path, pattern)
+
+        # Keep the newest GLOB_MAX_RESULTS files without sorting them all;
+        # ties go by path so the order doesn't depend on thread scheduling
+        total_count = len(file_matches)
+        truncated = total_count > GLOB_MAX_RESULTS
+        file_matches = heapq.nsmallest(
+            GLOB_MAX_RESULTS,
+            file_matches,
+            key=lambda entry: (-entry.stat().st_mtime, entry.path),
+        )
 
         # Format output
         if file_matches:
             # Convert to relative paths for cleaner output
-            try:
-                relative_paths = [str(m.relative_to(base_path)) for m in file_matches]
-            except ValueError:
-                # If relative path fails, use absolute paths
-                relative_paths = [str(m) for m in file_matches]
+            relative_paths = [
+                os.path.relpath(entry.path, base_path) for entry in file_matches
+            ]
 
             content = "\n".join(relative_paths)
             if truncated:
@@ -137,6 +316,7 @@ def _glob_files(pattern: str, path: str = ".") -> ToolResult:
                 "pattern": pattern,
                 "base_path": str(base_path),
                 "match_count": len(file_matches),
+                "total_count": total_count,
                 "truncated": truncated,
             },
         )
@@ -1,11 +1,23 @@
 """Web-related tools."""
 
+import asyncio
+import atexit
+import importlib.util
 import re
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
-from html.parser import HTMLParser
+from html import unescape
+from typing import Iterator
 
 import httpx
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - optional speedup
+    LexborHTMLParser = None
+
 from ..base import Tool, ToolMetadata, ToolParameter, ToolResult
 
 
@@ -13,80 +25,335 @@ from ..base import Tool, ToolMetadata, ToolParameter, ToolResult
 WEB_SEARCH_TTL = 3600   # 1 hour for search results
 WEB_PAGE_TTL = 7200     # 2 hours for webpage content
 
+# read_url stops downloading a page after this many bytes; the extracted
+# text is truncated to a few thousand characters anyway
+PAGE_MAX_BYTES = 1024 * 1024
+
+# Maximum number of URLs a single read_urls call may fetch
+READ_URLS_MAX_COUNT = 10
+
+# Result cache configuration (in seconds): repeated queries/URLs within this
+# window are answered from memory instead of a new HTTP round-trip
+SEARCH_CACHE_TTL = 300
+PAGE_CACHE_TTL = 600
+RESULT_CACHE_SIZE = 512
+
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+}
+
+# HTTP/2 needs the optional h2 package (httpx[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Connection pool shared by the sync and batch clients. Every connection may
+# stay alive between calls, so repeated requests to a host skip the TLS
+# handshake.
+_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=32,
+    max_connections=32,
+    keepalive_expiry=60,
+)
 
-class HTMLTextExtractor(HTMLParser):
-    """Simple HTML parser that extracts text content."""
+# Shared HTTP client so keep-alive connections are reused across tool calls
+_http_client: httpx.Client | None = None
+_http_client_lock = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    """Get the shared HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(
+                    http2=_HTTP2_AVAILABLE,
+                    timeout=30,
+                    follow_redirects=True,
+                    headers=HTTP_HEADERS,
+                    limits=_HTTP_LIMITS,
+                )
+                atexit.register(_http_client.close)
+    return _http_client
+
+
+class _ResultCache:
+    """Thread-safe LRU cache of successful ToolResults with a fixed TTL.
+
+    Entries stored with HTTP validators (ETag / Last-Modified) are kept past
+    their TTL so the next fetch can revalidate them with a conditional
+    request instead of downloading the body again.
+    """
 
-    def __init__(self):
-        super().__init__()
-        self.text_parts: list[str] = []
-        self.skip_tags = {"script", "style", "noscript"}
-        self.current_skip = False
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[
+            str, tuple[float, ToolResult, dict[str, str]]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> ToolResult | None:
+        """Return a fresh copy of the cached result, or None if absent/stale."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, result, validators = entry
+            if time.monotonic() >= expires_at:
+                if not validators:
+                    del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return _copy_result(result)
+
+    def revalidation_headers(self, key: str) -> dict[str, str]:
+        """Conditional request headers for a stale entry, if it has validators."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return {}
+        validators = entry[2]
+        headers = {}
+        if "etag" in validators:
+            headers["If-None-Match"] = validators["etag"]
+        if "last-modified" in validators:
+            headers["If-Modified-Since"] = validators["last-modified"]
+        return headers
+
+    def refresh(self, key: str) -> ToolResult | None:
+        """Restart the TTL of an entry the server reported as unchanged."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            _, result, validators = entry
+            self._entries[key] = (time.monotonic() + self.ttl, result, validators)
+            self._entries.move_to_end(key)
+        return _copy_result(result)
+
+    def put(
+        self,
+        key: str,
+        result: ToolResult,
+        validators: dict[str, str] | None = None,
+    ) -> None:
+        """Cache a result if it succeeded."""
+        if not result.success:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, result, validators or {})
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _copy_result(result: ToolResult) -> ToolResult:
+    """Reuse cached content under a new observation (fresh id and timestamp)."""
+    obs = result.observation
+    return ToolResult.from_success(
+        content=result.content,
+        tool_name=obs.source_id,
+        confidence=obs.confidence,
+        ttl_seconds=obs.ttl_seconds,
+        scope=obs.scope,
+        metadata=dict(obs.metadata),
+    )
+
+
+def _cache_validators(headers: httpx.Headers) -> dict[str, str]:
+    """Extract the response headers used to revalidate a cached page."""
+    validators = {}
+    for name in ("etag", "last-modified"):
+        value = headers.get(name)
+        if value:
+            validators[name] = value
+    return validators
+
+
+_search_cache = _ResultCache(RESULT_CACHE_SIZE, SEARCH_CACHE_TTL)
+_page_cache = _ResultCache(RESULT_CACHE_SIZE, PAGE_CACHE_TTL)
+
+
+def clear_web_cache() -> None:
+    """Drop all cached web_search and read_url results."""
+    _search_cache.clear()
+    _page_cache.clear()
+
+
+# DuckDuckGo marks result fields with class="result__<field>" on <a> tags
+_RESULT_CLASS_MARKER = 'class="result__'
+_RESULT_FIELDS = {"a": 0, "snippet": 1, "url": 2}
+_TAG_RE = re.compile(r"<[^<>]+>")
+
+
+def _scan_search_results(
+    html: str, limit: int = 5
+) -> tuple[list[str], list[str], list[str]]:
+    """Collect raw title, snippet and URL bodies from a DuckDuckGo page.
+
+    Makes a single forward pass, jumping between ``class="result__`` markers
+    with ``str.find`` and stopping as soon as ``limit`` of each field are
+    found, instead of running one DOTALL regex over the whole page per field.
 
-    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-        if tag in self.skip_tags:
-            self.current_skip = True
+    Args:
+        html: DuckDuckGo HTML results page.
+        limit: Maximum number of entries to collect per field.
 
-    def handle_endtag(self, tag: str) -> None:
-        if tag in self.skip_tags:
-            self.current_skip = False
+    Returns:
+        Tuple of (titles, snippets, urls), each holding raw inner HTML.
+    """
+    fields: tuple[list[str], list[str], list[str]] = ([], [], [])
+    marker_len = len(_RESULT_CLASS_MARKER)
 
-    def handle_data(self, data: str) -> None:
-        if not self.current_skip:
-            text = data.strip()
-            if text:
-                self.text_parts.append(text)
+    pos = html.find(_RESULT_CLASS_MARKER)
+    while pos != -1:
+        name_start = pos + marker_len
+        name_end = html.find('"', name_start)
+        if name_end == -1:
+            break
 
-    def get_text(self) -> str:
-        return " ".join(self.text_parts)
+        index = _RESULT_FIELDS.get(html[name_start:name_end])
+        if index is None or len(fields[index]) >= limit:
+            pos = html.find(_RESULT_CLASS_MARKER, name_end)
+            continue
 
+        body_start = html.find(">", name_end)
+        if body_start == -1:
+            break
+        body_end = html.find("</a>", body_start)
+        if body_end == -1:
+            break
 
-def extract_text_from_html(html: str) -> str:
-    """Extract readable text from HTML content."""
-    parser = HTMLTextExtractor()
-    parser.feed(html)
-    return parser.get_text()
+        fields[index].append(html[body_start + 1:body_end])
+        if all(len(values) >= limit for values in fields):
+            break
+        pos = html.find(_RESULT_CLASS_MARKER, body_end)
+
+    return fields
+
+
+def _parse_search_results(
+    html: str, limit: int = 5
+) -> tuple[list[str], list[str], list[str]]:
+    """Extract plain-text titles, snippets and URLs from a DuckDuckGo page.
+
+    Uses selectolax's C parser with CSS selectors when it is installed,
+    otherwise the ``str.find`` scan plus a tag strip per field.
+
+    Args:
+        html: DuckDuckGo HTML results page.
+        limit: Maximum number of entries to collect per field.
+
+    Returns:
+        Tuple of (titles, snippets, urls) with tags removed.
+    """
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html)
+        return tuple(
+            [node.text().strip() for node in tree.css(selector)[:limit]]
+            for selector in (".result__a", ".result__snippet", ".result__url")
+        )
+
+    return tuple(
+        [unescape(_TAG_RE.sub("", value)).strip() for value in values]
+        for values in _scan_search_results(html, limit)
+    )
+
+
+# Markup tokens, matched left to right by one compiled regex:
+# script/style/noscript blocks (content is never shown), comments, and tags.
+# Tag bodies never span a "<", which keeps failed matches from rescanning
+# the rest of the page and bounds the split to linear time.
+_MARKUP_RE = re.compile(
+    r"<(script|style|noscript)\b[^<>]*>.*?(?:</\1\s*>|\Z)"
+    r"|<!--.*?(?:-->|\Z)"
+    r"""|<[a-zA-Z/!?](?:"[^"]*"|'[^']*'|[^'"<>])*>""",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def _iter_text_runs(html: str) -> Iterator[str]:
+    """Yield the raw text between markup tokens, in document order."""
+    pos = 0
+    for match in _MARKUP_RE.finditer(html):
+        yield html[pos:match.start()]
+        pos = match.end()
+    yield html[pos:]
+
+
+def extract_text_from_html(html: str, max_chars: int | None = None) -> str:
+    """Extract readable text from HTML content.
+
+    Tokenizes with a compiled regex instead of ``html.parser`` so that no
+    Python-level callback runs per tag.
+
+    Args:
+        html: HTML content.
+        max_chars: Stop scanning once this many characters of text have been
+            collected. Callers that truncate the result can pass a bound a
+            little above their limit to avoid scanning the rest of the page.
+
+    Returns:
+        Text runs joined by single spaces.
+    """
+    text_parts = []
+    total = 0
+    for data in _iter_text_runs(html):
+        if "&" in data:
+            data = unescape(data)
+        data = data.strip()
+        if data:
+            text_parts.append(data)
+            total += len(data) + 1
+            if max_chars is not None and total > max_chars:
+                break
+    return " ".join(text_parts)
 
 
 def _web_search(query: str) -> ToolResult:
     """Search the web using DuckDuckGo HTML search.
 
+    Results are cached for ``SEARCH_CACHE_TTL`` seconds, keyed by the exact
+    query so each result keeps the scope and metadata of its own query.
+
     Args:
         query: Search query string.
 
     Returns:
         ToolResult with search results and provenance information.
     """
+    cached = _search_cache.get(query)
+    if cached is not None:
+        return cached
+
+    result = _fetch_search_results(query)
+    _search_cache.put(query, result)
+    return result
+
+
+def _fetch_search_results(query: str) -> ToolResult:
+    """Run a DuckDuckGo search and parse the results page."""
     tool_name = "web_search"
 
     try:
         url = "https://html.duckduckgo.com/html/"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        }
 
-        with httpx.Client(timeout=30, follow_redirects=True) as client:
-            response = client.post(url, data={"q": query}, headers=headers)
-            response.raise_for_status()
-            html = response.text
+        response = _get_client().post(url, data={"q": query})
+        response.raise_for_status()
+        html = response.text
 
         results = []
         source_urls = []
 
-        snippet_pattern = r'class="result__snippet"[^>]*>(.*?)</a>'
-        title_pattern = r'class="result__a"[^>]*>(.*?)</a>'
-        url_pattern = r'class="result__url"[^>]*>(.*?)</a>'
+        titles, snippets, urls = _parse_search_results(html, limit=5)
 
-        snippets = re.findall(snippet_pattern, html, re.DOTALL)
-        titles = re.findall(title_pattern, html, re.DOTALL)
-        urls = re.findall(url_pattern, html, re.DOTALL)
-
-        for i, (title, snippet) in enumerate(zip(titles[:5], snippets[:5])):
-            title_clean = re.sub(r'<[^>]+>', '', title).strip()
-            snippet_clean = re.sub(r'<[^>]+>', '', snippet).strip()
+        for i, (title_clean, snippet_clean) in enumerate(zip(titles, snippets)):
             if title_clean and snippet_clean:
                 result_url = urls[i] if i < len(urls) else ""
-                result_url = re.sub(r'<[^>]+>', '', result_url).strip()
                 results.append(f"{i+1}. {title_clean}\n   {snippet_clean}")
                 if result_url:
                     source_urls.append(result_url)
@@ -130,64 +397,228 @@ def _web_search(query: str) -> ToolResult:
 def _read_url(url: str) -> ToolResult:
     """Read and extract text content from a URL.
 
+    Results are cached per URL for ``PAGE_CACHE_TTL`` seconds, after which
+    pages that sent an ETag or Last-Modified header are revalidated with a
+    conditional request.
+
     Args:
         url: The URL to fetch.
 
     Returns:
         ToolResult with extracted content and provenance information.
     """
-    tool_name = "read_url"
+    cached = _page_cache.get(url)
+    if cached is not None:
+        return cached
+
+    return _fetch_page_text(url)
 
-    try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        }
 
-        with httpx.Client(timeout=30, follow_redirects=True) as client:
-            response = client.get(url, headers=headers)
+def _fetch_page_text(url: str) -> ToolResult:
+    """Fetch a URL, extract its readable text and cache the result."""
+    headers = _page_cache.revalidation_headers(url)
+    try:
+        with _get_client().stream("GET", url, headers=headers) as response:
+            if response.status_code == 304:
+                refreshed = _page_cache.refresh(url)
+                if refreshed is not None:
+                    return refreshed
             response.raise_for_status()
-            html = response.text
+            body = bytearray()
+            for chunk in response.iter_bytes():
+                body += chunk
+                if len(body) >= PAGE_MAX_BYTES:
+                    break
+            html = _decode_page(body, response.encoding)
+            validators = _cache_validators(response.headers)
+        result = _page_result(url, html)
+    except Exception as e:
+        return _page_error(e)
 
-        text = extract_text_from_html(html)
+    _page_cache.put(url, result, validators)
+    return result
 
-        max_length = 4000
-        truncated = False
-        if len(text) > max_length:
-            text = text[:max_length] + "...[内容已截断]"
-            truncated = True
 
-        if text:
-            return ToolResult.from_success(
-                content=text,
-                tool_name=tool_name,
-                confidence=1.0,
-                ttl_seconds=WEB_PAGE_TTL,
-                scope=f"url:{url}",
-                metadata={
-                    "url": url,
-                    "content_length": len(text),
-                    "truncated": truncated,
-                    "timestamp": datetime.now().isoformat(),
-                },
-            )
-        else:
-            return ToolResult.from_success(
-                content="无法提取页面内容",
-                tool_name=tool_name,
-                confidence=0.3,  # Low confidence for empty content
-                ttl_seconds=WEB_PAGE_TTL,
-                scope=f"url:{url}",
-                metadata={
-                    "url": url,
-                    "content_length": 0,
-                    "timestamp": datetime.now().isoformat(),
-                },
-            )
+def _decode_page(body: bytearray, encoding: str | None) -> str:
+    """Decode a (possibly cut-off) page body, capped at PAGE_MAX_BYTES."""
+    return body[:PAGE_MAX_BYTES].decode(encoding or "utf-8", errors="replace")
 
-    except httpx.HTTPError as e:
-        return ToolResult.from_error(f"读取URL失败: {e}", tool_name)
+
+def _page_result(url: str, html: str) -> ToolResult:
+    """Build the read_url result for a fetched HTML page."""
+    tool_name = "read_url"
+
+    max_length = 4000
+    # A small margin past the limit is enough to tell whether text was cut
+    text = extract_text_from_html(html, max_chars=max_length + 256)
+
+    truncated = False
+    if len(text) > max_length:
+        text = text[:max_length] + "...[内容已截断]"
+        truncated = True
+
+    if text:
+        return ToolResult.from_success(
+            content=text,
+            tool_name=tool_name,
+            confidence=1.0,
+            ttl_seconds=WEB_PAGE_TTL,
+            scope=f"url:{url}",
+            metadata={
+                "url": url,
+                "content_length": len(text),
+                "truncated": truncated,
+                "timestamp": datetime.now().isoformat(),
+            },
+        )
+    else:
+        return ToolResult.from_success(
+            content="无法提取页面内容",
+            tool_name=tool_name,
+            confidence=0.3,  # Low confidence for empty content
+            ttl_seconds=WEB_PAGE_TTL,
+            scope=f"url:{url}",
+            metadata={
+                "url": url,
+                "content_length": 0,
+                "timestamp": datetime.now().isoformat(),
+            },
+        )
+
+
+def _page_error(error: BaseException) -> ToolResult:
+    """Build the read_url result for a failed fetch."""
+    if isinstance(error, httpx.HTTPError):
+        return ToolResult.from_error(f"读取URL失败: {error}", "read_url")
+    return ToolResult.from_error(f"读取出错: {error}", "read_url")
+
+
+async def _fetch_pages(
+    urls: list[str],
+) -> list[ToolResult | tuple[str, dict[str, str]] | BaseException]:
+    """Fetch several pages concurrently over one pooled async client.
+
+    Returns, in the order of ``urls``, one of: the refreshed cached result
+    when the server answered 304 Not Modified, a tuple of (HTML, cache
+    validators), or the exception raised for that page.
+    """
+    async with httpx.AsyncClient(
+        http2=_HTTP2_AVAILABLE,
+        timeout=30,
+        follow_redirects=True,
+        headers=HTTP_HEADERS,
+        limits=_HTTP_LIMITS,
+    ) as client:
+
+        async def fetch(url: str) -> ToolResult | tuple[str, dict[str, str]]:
+            headers = _page_cache.revalidation_headers(url)
+            async with client.stream("GET", url, headers=headers) as response:
+                if response.status_code == 304:
+                    refreshed = _page_cache.refresh(url)
+                    if refreshed is not None:
+                        return refreshed
+                response.raise_for_status()
+                body = bytearray()
+                async for chunk in response.aiter_bytes():
+                    body += chunk
+                    if len(body) >= PAGE_MAX_BYTES:
+                        break
+                html = _decode_page(body, response.encoding)
+                return html, _cache_validators(response.headers)
+
+        return await asyncio.gather(
+            *(fetch(url) for url in urls), return_exceptions=True
+        )
+
+
+def read_url_many(urls: list[str]) -> list[ToolResult]:
+    """Read several URLs concurrently.
+
+    Equivalent to calling ``read_url`` on each URL, but uncached pages are
+    fetched in parallel (over HTTP/2 when the ``h2`` package is installed).
+    Must not be called from inside a running event loop.
+
+    Args:
+        urls: URLs to fetch.
+
+    Returns:
+        One ToolResult per URL, in the same order.
+    """
+    results: list[ToolResult | None] = [_page_cache.get(url) for url in urls]
+    pending = list(dict.fromkeys(
+        url for url, result in zip(urls, results) if result is None
+    ))
+
+    if pending:
+        fetched: dict[str, ToolResult] = {}
+        for url, outcome in zip(pending, asyncio.run(_fetch_pages(pending))):
+            if isinstance(outcome, ToolResult):
+                fetched[url] = outcome
+            elif isinstance(outcome, BaseException):
+                fetched[url] = _page_error(outcome)
+            else:
+                html, validators = outcome
+                fetched[url] = _page_result(url, html)
+                _page_cache.put(url, fetched[url], validators)
+
+        results = [
+            result if result is not None else fetched[url]
+            for url, result in zip(urls, results)
+        ]
+
+    return results
+
+
+def _read_urls(urls: list[str]) -> ToolResult:
+    """Read several URLs concurrently and combine their text.
+
+    Args:
+        urls: URLs to fetch (at most ``READ_URLS_MAX_COUNT``).
+
+    Returns:
+        ToolResult with one section per URL. Fails only if no page could be
+        read; individual failures are reported in their section.
+    """
+    tool_name = "read_urls"
+
+    if not urls:
+        return ToolResult.from_error("URL列表为空", tool_name)
+    if len(urls) > READ_URLS_MAX_COUNT:
+        return ToolResult.from_error(
+            f"URL数量过多: {len(urls)} (最多 {READ_URLS_MAX_COUNT} 个)", tool_name
+        )
+
+    try:
+        results = read_url_many(urls)
     except Exception as e:
-        return ToolResult.from_error(f"读取出错: {e}", tool_name)
+        return ToolResult.from_error(f"读取URL出错: {e}", tool_name)
+
+    sections = []
+    succeeded = []
+    failed = []
+    for i, (url, result) in enumerate(zip(urls, results)):
+        sections.append(f"[{i+1}] {url}\n{result.content}")
+        if result.success:
+            succeeded.append(result)
+        else:
+            failed.append(url)
+
+    content = "\n\n".join(sections)
+    if not succeeded:
+        return ToolResult.from_error(content, tool_name)
+
+    return ToolResult.from_success(
+        content=content,
+        tool_name=tool_name,
+        confidence=min(r.observation.confidence for r in succeeded),
+        ttl_seconds=WEB_PAGE_TTL,
+        scope=f"urls:{len(urls)}",
+        metadata={
+            "urls": list(urls),
+            "failed_urls": failed,
+            "timestamp": datetime.now().isoformat(),
+        },
+    )
 
 
 # Tool definitions
@@ -227,5 +658,24 @@ read_url = Tool(
     execute=_read_url,
 )
 
+read_urls = Tool(
+    metadata=ToolMetadata(
+        name="read_urls",
+        description="并发读取多个URL的网页内容。需要同时查看多个网页时使用，比逐个调用 read_url 更快。",
+        category="web",
+        parameters=[
+            ToolParameter(
+                name="urls",
+                type="array",
+                description=f"要读取的URL地址列表（最多 {READ_URLS_MAX_COUNT} 个）",
+                required=True,
+                items={"type": "string"},
+            )
+        ],
+        skill_bindings=["research"],
+    ),
+    execute=_read_urls,
+)
+
 # Export all tools from this category
-WEB_TOOLS = [web_search, read_url]
+WEB_TOOLS = [web_search, read_url, read_urls]
@@ -1,6 +1,8 @@
 """Tool registry for managing and accessing tools."""
 
-from typing import Any
+import asyncio
+import inspect
+from typing import Any, Iterable
 
 from .base import Tool, ToolResult
 
@@ -40,7 +42,11 @@ class ToolRegistry:
 
     def __init__(self) -> None:
         self._tools: dict[str, Tool] = {}
-        self._categories: dict[str, list[str]] = {}
+        # category -> tool names; a dict keeps registration order with O(1)
+        # membership checks
+        self._categories: dict[str, dict[str, None]] = {}
+        # A tuple so copies can share it without one caller's edits leaking
+        self._openai_tools: tuple[dict[str, Any], ...] | None = None
 
     def register(self, tool: Tool) -> None:
         """Register a tool.
@@ -48,12 +54,34 @@ class ToolRegistry:
         Args:
             tool: Tool instance to register.
         """
-        self._tools[tool.name] = tool
+        self.register_many((tool,))
 
-        if tool.category not in self._categories:
-            self._categories[tool.category] = []
-        if tool.name not in self._categories[tool.category]:
-            self._categories[tool.category].append(tool.name)
+    def register_many(self, tools: Iterable[Tool]) -> None:
+        """Register several tools, invalidating the schema list once.
+
+        Args:
+            tools: Tool instances to register, in order.
+        """
+        registered = self._tools
+        categories = self._categories
+        for tool in tools:
+            registered[tool.name] = tool
+            categories.setdefault(tool.category, {})[tool.name] = None
+        self._openai_tools = None
+
+    def copy(self) -> "ToolRegistry":
+        """Create an independent registry with the same tools.
+
+        Returns:
+            New ToolRegistry; registering on it does not affect this one.
+        """
+        registry = ToolRegistry()
+        registry._tools = dict(self._tools)
+        registry._categories = {
+            category: dict(names) for category, names in self._categories.items()
+        }
+        registry._openai_tools = self._openai_tools
+        return registry
 
     def get(self, name: str) -> Tool | None:
         """Get a tool by name.
@@ -75,7 +103,7 @@ class ToolRegistry:
         Returns:
             List of tools in the category.
         """
-        tool_names = self._categories.get(category, [])
+        tool_names = self._categories.get(category, {})
         return [self._tools[name] for name in tool_names]
 
     def get_for_skill(self, skill_tools: list[str]) -> list[Tool]:
@@ -104,6 +132,10 @@ class ToolRegistry:
     def execute(self, name: str, arguments: dict[str, Any]) -> ExecutionResult:
         """Execute a tool by name.
 
+        Async tools are run to completion with ``asyncio.run``. From inside a
+        running event loop that is impossible, so such calls fail and
+        ``execute_async`` must be used instead.
+
         Args:
             name: Tool name.
             arguments: Tool arguments.
@@ -119,36 +151,101 @@ class ToolRegistry:
                 success=False,
             )
 
+        execute = tool.execute
         try:
-            result = tool.execute(**arguments)
+            result = execute(**arguments)
+        except TypeError as e:
+            return self._argument_error(name, e)
+        except Exception as e:
+            return self._execution_error(name, e)
 
-            # Handle both string and ToolResult returns
-            if isinstance(result, ToolResult):
-                return ExecutionResult(
-                    content=result.content,
-                    tool_result=result,
-                    success=result.success,
-                )
+        if inspect.isawaitable(result):
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                pass
             else:
-                # Legacy string return - wrap in ExecutionResult without provenance
+                if inspect.iscoroutine(result):
+                    result.close()  # Avoid the "never awaited" warning
+                error = f"异步工具 {name} 不能在运行中的事件循环内同步执行，请使用 execute_async"
                 return ExecutionResult(
-                    content=str(result),
-                    tool_result=None,
-                    success=True,
+                    content=error,
+                    tool_result=ToolResult.from_error(error, name),
+                    success=False,
                 )
+            try:
+                # Async tool called from synchronous code
+                result = asyncio.run(result)
+            except Exception as e:
+                return self._execution_error(name, e)
+        return self._wrap_result(result)
 
-        except TypeError as e:
+    async def execute_async(
+        self, name: str, arguments: dict[str, Any]
+    ) -> ExecutionResult:
+        """Execute a tool by name without blocking the event loop.
+
+        Coroutine tools are awaited; synchronous tools (blocking I/O such as
+        ask_user's ``input()``) run in a worker thread.
+
+        Args:
+            name: Tool name.
+            arguments: Tool arguments.
+
+        Returns:
+            ExecutionResult with content and optional provenance.
+        """
+        tool = self._tools.get(name)
+        if tool is None:
             return ExecutionResult(
-                content=f"参数错误: {e}",
-                tool_result=ToolResult.from_error(f"参数错误: {e}", name),
+                content=f"未知工具: {name}",
+                tool_result=None,
                 success=False,
             )
+
+        execute = tool.execute
+        try:
+            if inspect.iscoroutinefunction(execute):
+                result = await execute(**arguments)
+            else:
+                result = await asyncio.to_thread(execute, **arguments)
+        except TypeError as e:
+            return self._argument_error(name, e)
         except Exception as e:
+            return self._execution_error(name, e)
+        return self._wrap_result(result)
+
+    @staticmethod
+    def _wrap_result(result: ToolResult | str) -> ExecutionResult:
+        # Handle both string and ToolResult returns
+        if isinstance(result, ToolResult):
             return ExecutionResult(
-                content=f"执行错误: {type(e).__name__}: {e}",
-                tool_result=ToolResult.from_error(f"{type(e).__name__}: {e}", name),
-                success=False,
+                content=result.content,
+                tool_result=result,
+                success=result.success,
             )
+        # Legacy string return - wrap in ExecutionResult without provenance
+        return ExecutionResult(
+            content=str(result),
+            tool_result=None,
+            success=True,
+        )
+
+    @staticmethod
+    def _argument_error(name: str, error: TypeError) -> ExecutionResult:
+        return ExecutionResult(
+            content=f"参数错误: {error}",
+            tool_result=ToolResult.from_error(f"参数错误: {error}", name),
+            success=False,
+        )
+
+    @staticmethod
+    def _execution_error(name: str, error: Exception) -> ExecutionResult:
+        return ExecutionResult(
+            content=f"执行错误: {type(error).__name__}: {error}",
+            tool_result=ToolResult.from_error(f"{type(error).__name__}: {error}", name),
+            success=False,
+        )
 
     def execute_simple(self, name: str, arguments: dict[str, Any]) -> str:
         """Execute a tool and return only the content string.
@@ -175,9 +272,22 @@ class ToolRegistry:
             List of OpenAI tool schemas.
         """
         if tools is None:
-            tools = self.get_all()
+            return list(self.openai_tools)
         return [tool.to_openai_schema() for tool in tools]
 
+    @property
+    def openai_tools(self) -> tuple[dict[str, Any], ...]:
+        """OpenAI schemas for all registered tools, rebuilt only after register().
+
+        Shared with copies of this registry; use ``to_openai_schema()`` for a
+        list that can be modified.
+        """
+        if self._openai_tools is None:
+            self._openai_tools = tuple(
+                tool.to_openai_schema() for tool in self._tools.values()
+            )
+        return self._openai_tools
+
     @property
     def categories(self) -> list[str]:
         """Get all category names."""
@@ -0,0 +1,85 @@
+"""Shared fixtures for agent-level tests."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from funnel_canary.agent import ProblemSolvingAgent
+
+
+@pytest.fixture(scope="session")
+def make_response():
+    """Factory for fake OpenAI chat completion responses.
+
+    Responses are plain SimpleNamespace objects exposing only the attributes
+    the agent reads (``choices[0].message`` and ``finish_reason``).
+    """
+
+    def make(content=None, tool_calls=None, finish_reason="stop"):
+        message = SimpleNamespace(
+            role="assistant", content=content, tool_calls=tool_calls
+        )
+        choice = SimpleNamespace(message=message, finish_reason=finish_reason)
+        return SimpleNamespace(choices=[choice])
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def make_tool_call():
+    """Factory for fake OpenAI tool call objects."""
+
+    def make(id, name, arguments):
+        function = SimpleNamespace(name=name, arguments=arguments)
+        return SimpleNamespace(id=id, function=function)
+
+    return make
+
+
+@pytest.fixture(scope="class")
+def _patched_openai(openai_client_template):
+    """Point the agent's OpenAI class at the cached client for a test class.
+
+    Uses a class-scoped MonkeyPatch since the ``monkeypatch`` fixture is
+    function-scoped.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "funnel_canary.agent.OpenAI",
+            lambda *args, **kwargs: openai_client_template,
+        )
+        yield openai_client_template
+
+
+@pytest.fixture
+def mock_client(_patched_openai):
+    """The fake OpenAI client returned to agents, reset for each test."""
+    _patched_openai.reset_mock(return_value=True, side_effect=True)
+    return _patched_openai
+
+
+@pytest.fixture(autouse=True)
+def silent_print(monkeypatch):
+    """Silence the agent's console output for every agent test."""
+    monkeypatch.setattr("builtins.print", lambda *args, **kwargs: None)
+
+
+@pytest.fixture
+def agent_factory(mock_client, mock_config):
+    """Factory for agents wired to the fake OpenAI client.
+
+    Defaults to a short iteration budget with memory and skills disabled;
+    keyword arguments override any ``ProblemSolvingAgent`` parameter.
+    """
+
+    def make(**overrides):
+        kwargs = {
+            "config": mock_config,
+            "max_iterations": 5,
+            "enable_memory": False,
+            "enable_skills": False,
+        }
+        kwargs.update(overrides)
+        return ProblemSolvingAgent(**kwargs)
+
+    return make
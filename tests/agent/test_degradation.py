@@ -9,125 +9,58 @@ Based on the test plan:
 - D05: Expired observations -> REQUEST_MORE_INFO
 """
 
-from datetime import datetime, timedelta
-from unittest.mock import MagicMock, patch
-
 import pytest
 
-from funnel_canary.provenance import (
-    DegradationLevel,
-    Observation,
-    ObservationType,
-    ProvenanceRegistry,
-)
-from funnel_canary.provenance.generator import GroundedAnswerGenerator
-
-
-class TestDegradationLevels:
-    """Test degradation level determination."""
-
-    @pytest.mark.agent
-    def test_d01_full_answer_high_confidence(self):
-        """D01: High confidence observations should allow full answer."""
-        registry = ProvenanceRegistry()
-
-        # Add multiple high-confidence observations
-        for i in range(3):
-            registry.add_observation(Observation(
-                content=f"High confidence observation {i}",
-                source_type=ObservationType.TOOL_RETURN,
-                source_id="web_search",
-                confidence=1.0,
-                ttl_seconds=3600,
-            ))
-
-        level = registry.determine_degradation_level()
-        assert level == DegradationLevel.FULL_ANSWER
+from funnel_canary.provenance import DegradationLevel, GroundedAnswerGenerator
 
-    @pytest.mark.agent
-    def test_d02_partial_medium_confidence(self):
-        """D02: Medium confidence should result in partial answer with uncertainty."""
-        registry = ProvenanceRegistry()
-
-        # Add observations with medium confidence
-        registry.add_observation(Observation(
-            content="Medium confidence observation",
-            source_type=ObservationType.USER_INPUT,
-            source_id="user",
-            confidence=0.6,
-        ))
-        registry.add_observation(Observation(
-            content="Another medium confidence",
-            source_type=ObservationType.USER_INPUT,
-            source_id="user",
-            confidence=0.7,
-        ))
 
-        level = registry.determine_degradation_level()
-        assert level == DegradationLevel.PARTIAL_WITH_UNCERTAINTY
+# Any of these in a formatted answer signals a partial/uncertain result
+_UNCERTAINTY_MARKERS = ("⚠️", "不确定", "部分")
 
-    @pytest.mark.agent
-    def test_d03_low_confidence_request_info(self):
-        """D03: Low confidence should request more information."""
-        registry = ProvenanceRegistry()
-
-        # Add only low-confidence observations
-        registry.add_observation(Observation(
-            content="Low confidence observation",
-            source_type=ObservationType.USER_INPUT,
-            source_id="user",
-            confidence=0.3,
-        ))
 
-        level = registry.determine_degradation_level(min_confidence=0.5)
-        assert level == DegradationLevel.REQUEST_MORE_INFO
+@pytest.fixture(scope="module")
+def generator():
+    """Shared generator; generate() keeps no per-call state."""
+    return GroundedAnswerGenerator()
 
-    @pytest.mark.agent
-    def test_d04_no_observations_refuse(self):
-        """D04: No observations should result in refusal."""
-        registry = ProvenanceRegistry()
 
-        # Empty registry
-        level = registry.determine_degradation_level()
-        assert level == DegradationLevel.REFUSE
+class TestDegradationLevels:
+    """Test degradation level determination."""
 
     @pytest.mark.agent
-    def test_d05_expired_observations_request_info(self):
-        """D05: Expired observations should request fresh information."""
-        registry = ProvenanceRegistry()
-
-        # Add an expired observation
-        expired_obs = Observation(
-            content="Old information",
-            source_type=ObservationType.TOOL_RETURN,
-            source_id="web_search",
-            confidence=1.0,
-            ttl_seconds=1,  # Very short TTL
-        )
-        # Backdate the timestamp
-        expired_obs.timestamp = datetime.now() - timedelta(seconds=10)
-        registry.add_observation(expired_obs)
+    @pytest.mark.parametrize(
+        "template, expected_level",
+        [
+            # D01: Multiple high-confidence observations allow a full answer
+            pytest.param("high", DegradationLevel.FULL_ANSWER, id="D01"),
+            # D02: Medium confidence gives a partial answer with uncertainty
+            pytest.param(
+                "medium", DegradationLevel.PARTIAL_WITH_UNCERTAINTY, id="D02"
+            ),
+            # D03: Only low-confidence observations ask for more information
+            pytest.param("low", DegradationLevel.REQUEST_MORE_INFO, id="D03"),
+            # D04: An empty registry is refused
+            pytest.param("empty", DegradationLevel.REFUSE, id="D04"),
+            # D05: Expired observations don't count, leaving nothing valid
+            pytest.param("expired", DegradationLevel.REFUSE, id="D05"),
+        ],
+    )
+    def test_degradation_level(self, make_registry, template, expected_level):
+        """D01-D05: Observation quality determines the degradation level."""
+        registry = make_registry(template)
 
-        # Should not count expired observations
-        level = registry.determine_degradation_level()
-        assert level == DegradationLevel.REFUSE  # No valid observations
+        level = registry.determine_degradation_level(min_confidence=0.5)
+        assert level == expected_level
 
 
 class TestGroundedAnswerGenerator:
     """Test the grounded answer generator."""
 
     @pytest.mark.agent
-    def test_generator_creates_grounded_answer(self):
+    def test_generator_creates_grounded_answer(self, generator, make_registry):
         """Generator should create properly grounded answers."""
-        registry = ProvenanceRegistry()
-        registry.add_observation(Observation(
-            content="Python is a programming language",
-            source_type=ObservationType.TOOL_RETURN,
-            source_id="web_search",
-            confidence=1.0,
-        ))
+        registry = make_registry("single_high")
 
-        generator = GroundedAnswerGenerator()
         grounded = generator.generate(
             raw_answer="Python is a popular programming language.",
             registry=registry,
@@ -138,17 +71,10 @@ class TestGroundedAnswerGenerator:
         assert grounded.degradation_level == DegradationLevel.FULL_ANSWER
 
     @pytest.mark.agent
-    def test_generator_adds_uncertainty_note(self):
+    def test_generator_adds_uncertainty_note(self, generator, make_registry):
         """Generator should add uncertainty note for partial answers."""
-        registry = ProvenanceRegistry()
-        registry.add_observation(Observation(
-            content="Some info",
-            source_type=ObservationType.USER_INPUT,
-            source_id="user",
-            confidence=0.5,
-        ))
+        registry = make_registry("partial")
 
-        generator = GroundedAnswerGenerator()
         grounded = generator.generate(
             raw_answer="Based on limited information...",
             registry=registry,
@@ -159,11 +85,10 @@ class TestGroundedAnswerGenerator:
         assert "不确定" in formatted or grounded.degradation_level != DegradationLevel.FULL_ANSWER
 
     @pytest.mark.agent
-    def test_generator_handles_empty_registry(self):
+    def test_generator_handles_empty_registry(self, generator, make_registry):
         """Generator should handle empty registry gracefully."""
-        registry = ProvenanceRegistry()
+        registry = make_registry("empty")
 
-        generator = GroundedAnswerGenerator()
         grounded = generator.generate(
             raw_answer="This answer has no backing.",
             registry=registry,
@@ -176,81 +101,45 @@ class TestDegradationInAgent:
     """Test degradation behavior in the full agent context."""
 
     @pytest.mark.agent
-    def test_agent_with_high_confidence_tools(self, mock_config):
+    @pytest.mark.slow
+    def test_agent_with_high_confidence_tools(
+        self, agent_factory, mock_client, make_response, make_tool_call
+    ):
         """Agent should produce full answers with high-confidence tool results."""
-        with patch("funnel_canary.agent.OpenAI") as mock_openai:
-            mock_client = MagicMock()
-            mock_openai.return_value = mock_client
-
-            # Tool call that returns high confidence result
-            class MockToolCall:
-                def __init__(self):
-                    self.id = "call_1"
-                    self.function = MagicMock()
-                    self.function.name = "python_exec"
-                    self.function.arguments = '{"code": "print(2+2)"}'
-
-            class MockMessage:
-                def __init__(self, content, tool_calls=None):
-                    self.role = "assistant"
-                    self.content = content
-                    self.tool_calls = tool_calls
-
-            class MockChoice:
-                def __init__(self, message, finish_reason):
-                    self.message = message
-                    self.finish_reason = finish_reason
-
-            class MockResponse:
-                def __init__(self, choices):
-                    self.choices = choices
-
-            # First call: tool execution
-            first_msg = MockMessage("Calculating...", [MockToolCall()])
-            first_response = MockResponse([MockChoice(first_msg, "tool_calls")])
-
-            # Second call: final answer
-            second_msg = MockMessage("The answer is 4.")
-            second_response = MockResponse([MockChoice(second_msg, "stop")])
-
-            mock_client.chat.completions.create.side_effect = [
-                first_response,
-                second_response
-            ]
-
-            from funnel_canary.agent import ProblemSolvingAgent
-
-            agent = ProblemSolvingAgent(
-                config=mock_config,
-                max_iterations=5,
-                enable_memory=False,
-                enable_skills=False,
-                enable_grounding=True,
-            )
-
-            with patch("builtins.print"):
-                result = agent.solve("What is 2+2?")
-
-            # With high-confidence tool result, should have observations
-            assert agent.get_observation_count() >= 2  # User input + tool result
+        # Tool call that returns high confidence result
+        tool_call = make_tool_call(
+            id="call_1",
+            name="python_exec",
+            arguments='{"code": "print(2+2)"}',
+        )
+
+        # First call: tool execution
+        first_response = make_response("Calculating...", [tool_call], "tool_calls")
+
+        # Second call: final answer
+        second_response = make_response("The answer is 4.", finish_reason="stop")
+
+        mock_client.chat.completions.create.side_effect = iter((
+            first_response,
+            second_response,
+        ))
+
+        agent = agent_factory(enable_grounding=True)
+
+        result = agent.solve("What is 2+2?")
+
+        # With high-confidence tool result, should have observations
+        assert agent.get_observation_count() >= 2  # User input + tool result
 
 
 class TestDegradationFormatting:
     """Test the formatting of degraded answers."""
 
     @pytest.mark.agent
-    def test_full_answer_no_extra_formatting(self):
+    def test_full_answer_no_extra_formatting(self, generator, make_registry):
         """Full answers should not have excessive formatting."""
-        registry = ProvenanceRegistry()
-        for i in range(3):
-            registry.add_observation(Observation(
-                content=f"Observation {i}",
-                source_type=ObservationType.TOOL_RETURN,
-                source_id="web_search",
-                confidence=1.0,
-            ))
-
-        generator = GroundedAnswerGenerator()
+        registry = make_registry("high")
+
         grounded = generator.generate(
             raw_answer="Clear answer here.",
             registry=registry,
@@ -260,17 +149,10 @@ class TestDegradationFormatting:
         assert grounded.degradation_level == DegradationLevel.FULL_ANSWER
 
     @pytest.mark.agent
-    def test_partial_answer_has_uncertainty_marker(self):
+    def test_partial_answer_has_uncertainty_marker(self, generator, make_registry):
         """Partial answers should have uncertainty markers."""
-        registry = ProvenanceRegistry()
-        registry.add_observation(Observation(
-            content="Limited info",
-            source_type=ObservationType.USER_INPUT,
-            source_id="user",
-            confidence=0.5,
-        ))
+        registry = make_registry("partial")
 
-        generator = GroundedAnswerGenerator()
         grounded = generator.generate(
             raw_answer="Based on what I know...",
             registry=registry,
@@ -279,19 +161,16 @@ class TestDegradationFormatting:
         formatted = grounded.to_formatted_output()
         # Should contain uncertainty marker
         assert (
-            "⚠️" in formatted or
-            "不确定" in formatted or
-            "部分" in formatted or
-            grounded.degradation_level == DegradationLevel.PARTIAL_WITH_UNCERTAINTY
+            any(marker in formatted for marker in _UNCERTAINTY_MARKERS)
+            or grounded.degradation_level == DegradationLevel.PARTIAL_WITH_UNCERTAINTY
         )
 
     @pytest.mark.agent
-    def test_refuse_has_clear_explanation(self):
+    def test_refuse_has_clear_explanation(self, generator, make_registry):
         """Refused answers should explain why."""
-        registry = ProvenanceRegistry()
         # Empty registry
+        registry = make_registry("empty")
 
-        generator = GroundedAnswerGenerator()
         grounded = generator.generate(
             raw_answer="I don't have enough information.",
             registry=registry,
@@ -1,14 +1,28 @@
 """Shared pytest fixtures for FunnelCanary tests."""
 
+import copy
 import os
+import shutil
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from openai import OpenAI
 
 from funnel_canary.provenance import Observation, ObservationType, ProvenanceRegistry
 from funnel_canary.tools.base import ToolResult
+from funnel_canary.tools.categories.filesystem import clear_file_cache
+from funnel_canary.tools.categories.web import clear_web_cache
+
+
+# Fixed epoch timestamp (2000-01-01 UTC) far enough back to expire any TTL
+_ANCIENT_TIMESTAMP = 946684800.0
+
+# File bodies shared by the file fixtures (bytes are immutable)
+_BINARY_256 = bytes(range(256))
+_X_100K = b"x" * 100_000
+_X_100K1 = _X_100K + b"x"
 
 
 # =============================================================================
@@ -43,7 +57,7 @@ def sample_python_file(temp_dir):
 def large_file(temp_dir):
     """Create a file larger than 100KB."""
     file_path = temp_dir / "large.txt"
-    file_path.write_bytes(b"x" * 100_001)  # Just over 100KB
+    file_path.write_bytes(_X_100K1)  # Just over 100KB
     return file_path
 
 
@@ -51,7 +65,7 @@ def large_file(temp_dir):
 def exact_100kb_file(temp_dir):
     """Create a file exactly 100KB."""
     file_path = temp_dir / "exact_100kb.txt"
-    file_path.write_bytes(b"x" * 100_000)
+    file_path.write_bytes(_X_100K)
     return file_path
 
 
@@ -59,7 +73,7 @@ def exact_100kb_file(temp_dir):
 def binary_file(temp_dir):
     """Create a binary file with non-UTF8 content."""
     file_path = temp_dir / "binary.bin"
-    file_path.write_bytes(bytes(range(256)))
+    file_path.write_bytes(_BINARY_256)
     return file_path
 
 
@@ -95,36 +109,54 @@ def no_permission_file(temp_dir):
 # =============================================================================
 
 
-@pytest.fixture
-def structured_dir(temp_dir):
-    """Create a structured directory for glob testing."""
+@pytest.fixture(scope="session")
+def structured_dir(tmp_path_factory):
+    """Create a structured directory for glob testing.
+
+    Shared by the whole session; tests that modify it must use
+    ``mutable_structured_dir`` instead.
+    """
+    base = tmp_path_factory.mktemp("structured")
+
     # Create directories
-    (temp_dir / "src").mkdir()
-    (temp_dir / "src" / "module").mkdir()
-    (temp_dir / "tests").mkdir()
-    (temp_dir / "docs").mkdir()
+    (base / "src").mkdir()
+    (base / "src" / "module").mkdir()
+    (base / "tests").mkdir()
+    (base / "docs").mkdir()
 
     # Create Python files
-    (temp_dir / "main.py").write_text("# main")
-    (temp_dir / "src" / "app.py").write_text("# app")
-    (temp_dir / "src" / "utils.py").write_text("# utils")
-    (temp_dir / "src" / "module" / "core.py").write_text("# core")
-    (temp_dir / "tests" / "test_main.py").write_text("# test main")
-    (temp_dir / "tests" / "test_app.py").write_text("# test app")
+    (base / "main.py").write_text("# main")
+    (base / "src" / "app.py").write_text("# app")
+    (base / "src" / "utils.py").write_text("# utils")
+    (base / "src" / "module" / "core.py").write_text("# core")
+    (base / "tests" / "test_main.py").write_text("# test main")
+    (base / "tests" / "test_app.py").write_text("# test app")
 
     # Create markdown files
-    (temp_dir / "README.md").write_text("# README")
-    (temp_dir / "docs" / "guide.md").write_text("# Guide")
+    (base / "README.md").write_text("# README")
+    (base / "docs" / "guide.md").write_text("# Guide")
 
-    return temp_dir
+    return base
 
 
 @pytest.fixture
-def many_files_dir(temp_dir):
-    """Create a directory with more than 100 files."""
+def mutable_structured_dir(structured_dir, tmp_path):
+    """Private copy of ``structured_dir`` that a test may modify."""
+    return Path(shutil.copytree(structured_dir, tmp_path / "structured"))
+
+
+@pytest.fixture(scope="session")
+def many_files_dir(tmp_path_factory):
+    """Create a directory with more than 100 files (shared, read-only)."""
+    base = tmp_path_factory.mktemp("many")
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
     for i in range(150):
-        (temp_dir / f"file_{i:03d}.txt").write_text(f"content {i}")
-    return temp_dir
+        fd = os.open(base / f"file_{i:03d}.txt", flags, 0o644)
+        try:
+            os.write(fd, b"content %d" % i)
+        finally:
+            os.close(fd)
+    return base
 
 
 # =============================================================================
@@ -166,8 +198,6 @@ def observation_user_input():
 @pytest.fixture
 def observation_expired():
     """Create an expired observation."""
-    from datetime import datetime, timedelta
-
     obs = Observation(
         content="Old data",
         source_type=ObservationType.TOOL_RETURN,
@@ -175,17 +205,105 @@ def observation_expired():
         confidence=1.0,
         ttl_seconds=1,  # 1 second TTL
         scope="search:old",
+        timestamp=_ANCIENT_TIMESTAMP,
     )
-    # Backdate the timestamp
-    obs.timestamp = datetime.now() - timedelta(seconds=10)
     return obs
 
 
+def _registry_with(*observations: Observation) -> ProvenanceRegistry:
+    registry = ProvenanceRegistry()
+    registry.add_observations(observations)
+    return registry
+
+
+@pytest.fixture(scope="session")
+def registry_templates():
+    """Canonical ProvenanceRegistry states, built once per session.
+
+    Templates are shared; use ``make_registry`` to get a private copy.
+    """
+    expired = Observation(
+        content="Old information",
+        source_type=ObservationType.TOOL_RETURN,
+        source_id="web_search",
+        confidence=1.0,
+        ttl_seconds=1,  # Very short TTL
+        timestamp=_ANCIENT_TIMESTAMP,
+    )
+
+    return {
+        "high": _registry_with(*(
+            Observation(
+                content=f"High confidence observation {i}",
+                source_type=ObservationType.TOOL_RETURN,
+                source_id="web_search",
+                confidence=1.0,
+                ttl_seconds=3600,
+            )
+            for i in range(3)
+        )),
+        "single_high": _registry_with(Observation(
+            content="Python is a programming language",
+            source_type=ObservationType.TOOL_RETURN,
+            source_id="web_search",
+            confidence=1.0,
+        )),
+        "medium": _registry_with(
+            Observation(
+                content="Medium confidence observation",
+                source_type=ObservationType.USER_INPUT,
+                source_id="user",
+                confidence=0.6,
+            ),
+            Observation(
+                content="Another medium confidence",
+                source_type=ObservationType.USER_INPUT,
+                source_id="user",
+                confidence=0.7,
+            ),
+        ),
+        "partial": _registry_with(Observation(
+            content="Limited info",
+            source_type=ObservationType.USER_INPUT,
+            source_id="user",
+            confidence=0.5,
+        )),
+        "low": _registry_with(Observation(
+            content="Low confidence observation",
+            source_type=ObservationType.USER_INPUT,
+            source_id="user",
+            confidence=0.3,
+        )),
+        "expired": _registry_with(expired),
+        "empty": ProvenanceRegistry(),
+    }
+
+
+@pytest.fixture
+def make_registry(registry_templates):
+    """Return a factory giving a deep copy of a named registry template."""
+
+    def make(name: str) -> ProvenanceRegistry:
+        return copy.deepcopy(registry_templates[name])
+
+    return make
+
+
 # =============================================================================
 # Mock fixtures
 # =============================================================================
 
 
+@pytest.fixture(autouse=True)
+def _clear_tool_caches():
+    """Keep cached web results and file contents from leaking between tests."""
+    clear_web_cache()
+    clear_file_cache()
+    yield
+    clear_web_cache()
+    clear_file_cache()
+
+
 @pytest.fixture
 def mock_httpx_client():
     """Mock httpx client for web tests."""
@@ -231,18 +349,18 @@ def mock_empty_search_response():
 # =============================================================================
 
 
-@pytest.fixture
-def mock_openai_client():
-    """Mock OpenAI client for agent tests."""
-    with patch("funnel_canary.agent.OpenAI") as mock:
-        client_instance = MagicMock()
-        mock.return_value = client_instance
-        yield client_instance
+@pytest.fixture(scope="session")
+def openai_client_template():
+    """OpenAI client mock built once per session.
 
+    Agent tests receive it through ``mock_client``, which resets it first.
+    """
+    return MagicMock(spec=OpenAI)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def mock_config():
-    """Mock configuration for agent tests."""
+    """Mock configuration for agent tests (shared; treat as read-only)."""
     from funnel_canary.config import Config
 
     return Config(
@@ -103,11 +103,10 @@ class TestWebToolErrorRecovery:
         """Web search should handle network errors."""
         import httpx
 
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_instance = MagicMock()
             mock_instance.post.side_effect = httpx.HTTPError("Network error")
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_get_client.return_value = mock_instance
 
             registry = create_default_registry()
             result = registry.execute("web_search", {"query": "test"})
@@ -120,7 +119,7 @@ class TestWebToolErrorRecovery:
         """Read URL should handle 404 errors."""
         import httpx
 
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_response = MagicMock()
             mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
                 "Not Found",
@@ -129,9 +128,8 @@ class TestWebToolErrorRecovery:
             )
 
             mock_instance = MagicMock()
-            mock_instance.get.return_value = mock_response
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_instance.stream.return_value.__enter__.return_value = mock_response
+            mock_get_client.return_value = mock_instance
 
             registry = create_default_registry()
             result = registry.execute("read_url", {"url": "https://example.com/404"})
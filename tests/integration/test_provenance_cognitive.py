@@ -6,7 +6,7 @@ Tests the interaction between:
 - Observation-based decision making
 """
 
-from datetime import datetime, timedelta
+import time
 
 import pytest
 
@@ -47,6 +47,57 @@ class TestProvenanceRegistryIntegration:
         assert provenance_registry.get_observation(obs1.id) is not None
         assert provenance_registry.get_observation(obs2.id) is not None
 
+    @pytest.mark.integration
+    def test_add_observations_matches_add_observation(self, provenance_registry):
+        """Bulk adds should index observations like repeated single adds."""
+        observations = [
+            Observation(
+                content=f"Observation {i}",
+                source_type=ObservationType.TOOL_RETURN,
+                source_id="web_search" if i % 2 else "read_url",
+                ttl_seconds=60 * (i + 1),
+            )
+            for i in range(4)
+        ]
+        single = ProvenanceRegistry()
+        for obs in observations:
+            single.add_observation(obs)
+
+        ids = provenance_registry.add_observations(observations)
+
+        assert ids == [obs.id for obs in observations]
+        assert provenance_registry.observations == single.observations
+        assert provenance_registry.get_observations_by_source("web_search") == (
+            single.get_observations_by_source("web_search")
+        )
+        assert provenance_registry._next_expiry == single._next_expiry
+        assert provenance_registry.add_observations([]) == []
+
+    @pytest.mark.integration
+    def test_update_observation_reindexes_source_and_type(self, provenance_registry):
+        """Changing source fields through the registry moves index entries."""
+        obs = Observation(
+            content="Answer",
+            source_type=ObservationType.TOOL_RETURN,
+            source_id="a",
+        )
+        provenance_registry.add_observation(obs)
+
+        provenance_registry.update_observation(
+            obs.id, source_id="b", source_type=ObservationType.USER_INPUT
+        )
+
+        assert provenance_registry.get_observations_by_source("a") == []
+        assert provenance_registry.get_observations_by_source("b") == [obs]
+        assert provenance_registry.get_observations_by_type(
+            ObservationType.TOOL_RETURN
+        ) == []
+        assert provenance_registry.get_observations_by_type(
+            ObservationType.USER_INPUT
+        ) == [obs]
+        with pytest.raises(ValueError):
+            provenance_registry.update_observation(obs.id, id="other")
+
     @pytest.mark.integration
     def test_expired_observations_filtered(self, provenance_registry):
         """Test that expired observations are filtered out."""
@@ -63,7 +114,7 @@ class TestProvenanceRegistryIntegration:
             ttl_seconds=1,
         )
         # Backdate the expired observation
-        expired_obs.timestamp = datetime.now() - timedelta(seconds=10)
+        expired_obs.timestamp = time.time() - 10
 
         provenance_registry.add_observation(valid_obs)
         provenance_registry.add_observation(expired_obs)
@@ -72,6 +123,50 @@ class TestProvenanceRegistryIntegration:
         assert len(valid_observations) == 1
         assert valid_observations[0].id == valid_obs.id
 
+    @pytest.mark.integration
+    def test_observation_backdated_after_registration(self, provenance_registry):
+        """Backdating a registered observation through the registry expires it."""
+        obs = Observation(
+            content="Search result",
+            source_type=ObservationType.TOOL_RETURN,
+            source_id="web_search",
+            ttl_seconds=3600,
+        )
+        provenance_registry.add_observation(obs)
+        assert len(provenance_registry.get_valid_observations()) == 1
+
+        provenance_registry.update_observation(obs.id, timestamp=time.time() - 7200)
+
+        assert obs.is_expired()
+        assert provenance_registry.get_valid_observations() == []
+        assert provenance_registry.invalidate_expired() == [obs.id]
+
+    @pytest.mark.integration
+    def test_observation_edits_after_registration(self, provenance_registry):
+        """TTL and confidence updates refresh the degradation stats."""
+        obs = Observation(
+            content="Search result",
+            source_type=ObservationType.TOOL_RETURN,
+            source_id="web_search",
+        )
+        provenance_registry.add_observation(obs)
+        assert provenance_registry._valid_confidence_stats(time.time()) == (1, 1.0)
+
+        provenance_registry.update_observation(obs.id, confidence=0.3)
+        assert (
+            provenance_registry.determine_degradation_level()
+            == DegradationLevel.REQUEST_MORE_INFO
+        )
+
+        provenance_registry.update_observation(
+            obs.id, timestamp=time.time() - 10, ttl_seconds=1
+        )
+        assert provenance_registry.get_valid_observations() == []
+        assert (
+            provenance_registry.determine_degradation_level()
+            == DegradationLevel.REFUSE
+        )
+
     @pytest.mark.integration
     def test_claim_confidence_computation(self, provenance_registry):
         """Test claim confidence based on source observations."""
@@ -102,6 +197,64 @@ class TestProvenanceRegistryIntegration:
         # Confidence should be minimum of source observations
         assert claim.confidence == 0.8
 
+    @pytest.mark.integration
+    def test_claim_confidence_refreshed_after_new_observation(self, provenance_registry):
+        """Memoized claim confidence is recomputed once observations change."""
+        obs = Observation(
+            content="Search result",
+            source_type=ObservationType.TOOL_RETURN,
+            source_id="web_search",
+            confidence=1.0,
+        )
+        provenance_registry.add_observation(obs)
+
+        claim = Claim(
+            statement="Claim citing a later observation",
+            claim_type=ClaimType.FACT,
+            source_observations=[obs.id, "late0001"],
+        )
+        provenance_registry.add_claim(claim)
+        assert claim.confidence == 1.0
+
+        provenance_registry.add_observation(Observation(
+            id="late0001",
+            content="Late user input",
+            source_type=ObservationType.USER_INPUT,
+            source_id="user",
+        ))
+
+        valid_claims = provenance_registry.get_valid_claims(refresh=True)
+        assert valid_claims[0].confidence == 0.8
+
+
+    @pytest.mark.integration
+    def test_claim_confidence_refreshed_after_observation_edit(
+        self, provenance_registry
+    ):
+        """Memoized claim confidence tracks observation updates."""
+        obs = Observation(
+            content="Search result",
+            source_type=ObservationType.TOOL_RETURN,
+            source_id="web_search",
+            ttl_seconds=3600,
+        )
+        provenance_registry.add_observation(obs)
+        claim = Claim(
+            statement="Derived claim",
+            claim_type=ClaimType.FACT,
+            source_observations=[obs.id],
+        )
+        provenance_registry.add_claim(claim)
+        assert claim.confidence == 1.0
+
+        provenance_registry.update_observation(obs.id, confidence=0.6)
+        provenance_registry.get_valid_claims(refresh=True)
+        assert claim.confidence == 0.6
+
+        provenance_registry.update_observation(obs.id, timestamp=time.time() - 7200)
+        provenance_registry.get_valid_claims(refresh=True)
+        assert claim.confidence == 0.0
+
 
 class TestDegradationLevels:
     """Integration tests for degradation level determination."""
@@ -109,13 +262,15 @@ class TestDegradationLevels:
     @pytest.mark.integration
     def test_full_answer_with_high_confidence(self, provenance_registry):
         """High confidence observations should allow full answer."""
-        for i in range(3):
-            provenance_registry.add_observation(Observation(
+        provenance_registry.add_observations([
+            Observation(
                 content=f"Observation {i}",
                 source_type=ObservationType.TOOL_RETURN,
                 source_id="web_search",
                 confidence=1.0,
-            ))
+            )
+            for i in range(3)
+        ])
 
         level = provenance_registry.determine_degradation_level()
         assert level == DegradationLevel.FULL_ANSWER
@@ -152,6 +307,36 @@ class TestDegradationLevels:
         level = provenance_registry.determine_degradation_level()
         assert level == DegradationLevel.REFUSE
 
+    @pytest.mark.integration
+    def test_level_tracks_added_and_expired_observations(self, provenance_registry):
+        """Repeated checks should reflect new and newly expired observations."""
+        provenance_registry.add_observation(Observation(
+            content="Low confidence obs",
+            source_type=ObservationType.USER_INPUT,
+            source_id="user",
+            confidence=0.3,
+        ))
+        assert (
+            provenance_registry.determine_degradation_level()
+            == DegradationLevel.REQUEST_MORE_INFO
+        )
+
+        provenance_registry.add_observation(Observation(
+            content="Short-lived obs",
+            source_type=ObservationType.TOOL_RETURN,
+            source_id="web_search",
+            confidence=1.0,
+            ttl_seconds=1,
+        ))
+        assert (
+            provenance_registry.determine_degradation_level()
+            == DegradationLevel.PARTIAL_WITH_UNCERTAINTY
+        )
+
+        # Once the short-lived observation expires, only the low one counts
+        now = time.time()
+        assert provenance_registry._valid_confidence_stats(now + 10) == (1, 0.3)
+
 
 class TestCognitiveStateWithProvenance:
     """Integration tests for CognitiveState with provenance tracking."""
@@ -3,12 +3,16 @@
 Tests the flow of tool results to the provenance system.
 """
 
+import asyncio
+import gc
 from unittest.mock import MagicMock, patch
+import warnings
 
 import pytest
 
 from funnel_canary.provenance import ObservationType, ProvenanceRegistry
 from funnel_canary.tools import ToolRegistry, create_default_registry
+from funnel_canary.tools.base import Tool, ToolMetadata, ToolResult
 
 
 class TestToolProvenanceIntegration:
@@ -67,15 +71,14 @@ class TestToolProvenanceIntegration:
         # Web search has a 1-hour TTL
         html_response = '<html><body><a class="result__a">Test</a><a class="result__snippet">Test</a></body></html>'
 
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_response = MagicMock()
             mock_response.text = html_response
             mock_response.raise_for_status = MagicMock()
 
             mock_instance = MagicMock()
             mock_instance.post.return_value = mock_response
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_get_client.return_value = mock_instance
 
             registry = create_default_registry()
             result = registry.execute("web_search", {"query": "test"})
@@ -97,6 +100,7 @@ class TestToolRegistryCategories:
         # Check for tools from each category
         assert "web_search" in tool_names  # web
         assert "read_url" in tool_names    # web
+        assert "read_urls" in tool_names   # web
         assert "python_exec" in tool_names  # compute
         assert "Bash" in tool_names         # compute
         assert "Read" in tool_names         # filesystem
@@ -115,6 +119,22 @@ class TestToolRegistryCategories:
         assert "web_search" in tool_names
         assert "read_url" in tool_names
 
+    @pytest.mark.integration
+    def test_register_many_matches_register(self):
+        """Batch registration builds the same registry as one-by-one."""
+        tools = create_default_registry().get_all()
+
+        single = ToolRegistry()
+        for tool_instance in tools:
+            single.register(tool_instance)
+        batch = ToolRegistry()
+        batch.register_many(tools)
+
+        assert batch.categories == single.categories
+        assert [t.name for t in batch.get_all()] == [t.name for t in single.get_all()]
+        for category in single.categories:
+            assert batch.get_by_category(category) == single.get_by_category(category)
+
     @pytest.mark.integration
     def test_tool_schema_generation(self):
         """Tool registry should generate valid OpenAI schema."""
@@ -132,6 +152,89 @@ class TestToolRegistryCategories:
             assert "description" in tool_schema["function"]
             assert "parameters" in tool_schema["function"]
 
+    @pytest.mark.integration
+    def test_tool_schema_reused_across_calls(self):
+        """Each tool's schema is built once and reused."""
+        registry = create_default_registry()
+        tools = registry.get_all()
+
+        first = registry.to_openai_schema(tools)
+        second = registry.to_openai_schema(tools)
+
+        assert all(a is b for a, b in zip(first, second))
+
+    @pytest.mark.integration
+    def test_schema_list_not_shared_between_registries(self):
+        """Editing one registry's schema list leaves later registries intact."""
+        first = create_default_registry()
+        expected = len(first.openai_tools)
+
+        first.to_openai_schema().append({"type": "function"})
+        with pytest.raises(AttributeError):
+            first.openai_tools.append({"type": "function"})
+
+        assert len(create_default_registry().to_openai_schema()) == expected
+
+
+class TestToolRegistryAsyncTools:
+    """Test async tools called through the synchronous execute()."""
+
+    @staticmethod
+    def _registry_with(execute):
+        registry = ToolRegistry()
+        registry.register(Tool(
+            metadata=ToolMetadata(
+                name="async_tool", description="", category="test"
+            ),
+            execute=execute,
+        ))
+        return registry
+
+    @pytest.mark.integration
+    def test_async_tool_runs_from_sync_code(self):
+        """Coroutine tools are run to completion outside an event loop."""
+        async def execute(value):
+            return ToolResult.from_success(value, "async_tool")
+
+        result = self._registry_with(execute).execute("async_tool", {"value": "ok"})
+
+        assert result.success is True
+        assert result.content == "ok"
+
+    @pytest.mark.integration
+    def test_async_tool_in_running_loop_points_to_execute_async(self):
+        """Inside an event loop execute() fails cleanly instead of raising."""
+        async def execute():
+            return "unreachable"
+
+        registry = self._registry_with(execute)
+
+        async def scenario():
+            return registry.execute("async_tool", {})
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", RuntimeWarning)
+            result = asyncio.run(scenario())
+            gc.collect()
+
+        assert result.success is False
+        assert "execute_async" in result.content
+
+    @pytest.mark.integration
+    def test_type_error_in_async_body_is_execution_error(self):
+        """Only TypeErrors from the call itself are argument errors."""
+        async def execute():
+            return len(None)
+
+        registry = self._registry_with(execute)
+
+        assert registry.execute("async_tool", {}).content.startswith(
+            "执行错误: TypeError"
+        )
+        assert registry.execute("async_tool", {"extra": 1}).content.startswith(
+            "参数错误"
+        )
+
 
 class TestToolProvenanceFlow:
     """Test the complete flow from tool to provenance."""
@@ -9,10 +9,13 @@ Test cases based on boundary testing plan:
 - A06: No TTL
 """
 
+import asyncio
+import threading
 from unittest.mock import patch
 
 import pytest
 
+from funnel_canary.tools import create_default_registry
 from funnel_canary.tools.categories.interaction import _ask_user, USER_INPUT_CONFIDENCE
 
 
@@ -202,3 +205,36 @@ class TestAskUserConstant:
     def test_user_input_confidence_constant(self):
         """Verify USER_INPUT_CONFIDENCE constant value."""
         assert USER_INPUT_CONFIDENCE == 0.8
+
+
+class TestAskUserAsync:
+    """Test ask_user through the registry's non-blocking execution path."""
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_input_does_not_block_event_loop(self, check_success):
+        """Other coroutines keep running while waiting for the user."""
+        registry = create_default_registry()
+        loop_ran = threading.Event()
+
+        def slow_input(prompt):
+            # Only answers once the event loop has run another task
+            return "answered" if loop_ran.wait(timeout=5) else "loop blocked"
+
+        async def other_task():
+            loop_ran.set()
+
+        async def scenario():
+            ask = asyncio.create_task(
+                registry.execute_async("ask_user", {"question": "继续吗?"})
+            )
+            await asyncio.sleep(0)
+            await other_task()
+            return await ask
+
+        with patch("builtins.input", side_effect=slow_input):
+            result = asyncio.run(scenario())
+
+        assert result.success is True
+        check_success(result.tool_result)
+        assert result.content == "answered"
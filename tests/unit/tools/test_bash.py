@@ -20,6 +20,7 @@ import pytest
 from funnel_canary.tools.categories.compute import (
     _bash_exec,
     _is_command_safe,
+    _split_simple_command,
     BASH_DEFAULT_TIMEOUT,
     BASH_MAX_TIMEOUT,
     BASH_COMMAND_BLACKLIST,
@@ -190,6 +191,56 @@ class TestBashToolSafetyChecker:
             assert error is not None
 
 
+class TestBashToolShellDetection:
+    """Test which commands can run without spawning a shell."""
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_simple_command_split_into_args(self):
+        """Plain commands are run directly as an argument list."""
+        assert _split_simple_command("echo hello world") == ["echo", "hello", "world"]
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_shell_features_use_shell(self):
+        """Commands needing shell parsing or builtins go through the shell."""
+        for command in [
+            "echo hello | wc -c",
+            "echo $HOME",
+            "echo 'quoted arg'",
+            "ls *.py",
+            "FOO=1 env",
+            "echo a\necho b",
+            "cd /tmp",
+            "exit 1",
+        ]:
+            assert _split_simple_command(command) is None, command
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_program_path_uses_shell(self):
+        """Programs given by path go through the shell."""
+        assert _split_simple_command("./script.sh") is None
+        assert _split_simple_command("/bin/echo hello") is None
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_split_only_on_shell_separators(self):
+        """Only spaces and tabs separate words, as in the shell."""
+        assert _split_simple_command(" echo  a\tb ") == ["echo", "a", "b"]
+        for arg in ["a\u3000b", "a\xa0b", "a\vb", "a\fb", "a\rb"]:
+            assert _split_simple_command(f"echo {arg}") == ["echo", arg], repr(arg)
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_ideographic_space_kept(self, check_success):
+        """Full-width spaces stay inside the argument."""
+        result = _bash_exec("echo 你好\u3000世界")
+
+        check_success(result)
+        assert result.content == "你好\u3000世界"
+
+
 class TestBashToolExecution:
     """Test cases for Bash tool execution."""
 
@@ -373,3 +424,16 @@ class TestBashToolExecution:
 
         check_success(result)
         assert "成功" in result.content or result.content == ""
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_script_without_shebang(self, check_success, tmp_path):
+        """Executable scripts without a shebang run as shell scripts."""
+        script = tmp_path / "script.sh"
+        script.write_text("echo hello\n")
+        script.chmod(0o755)
+
+        result = _bash_exec(str(script))
+
+        check_success(result)
+        assert result.content == "hello"
@@ -129,6 +129,7 @@ class TestGlobTool:
 
         check_success(result)
         assert result.observation.metadata["match_count"] == GLOB_MAX_RESULTS
+        assert result.observation.metadata["total_count"] == 150
         assert result.observation.metadata["truncated"] is True
         assert "已截断" in result.content
         assert str(GLOB_MAX_RESULTS) in result.content
@@ -238,3 +239,50 @@ class TestGlobTool:
         # Should include files but not directory names as matches
         assert "main.py" in content
         assert "README.md" in content
+
+
+class TestGlobWalk:
+    """Test that the concurrent directory walk keeps Path.glob semantics."""
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    @pytest.mark.parametrize("pattern", [
+        "**/*.py",
+        "src/**/*.py",
+        "*/*.py",
+        "src/module/core.py",
+        "**/test_*.py",
+        "**/[mR]*",
+    ])
+    def test_matches_pathlib(self, structured_dir, pattern):
+        """Results equal Path.glob for the same pattern."""
+        expected = sorted(
+            str(m.relative_to(structured_dir))
+            for m in structured_dir.glob(pattern)
+            if m.is_file()
+        )
+
+        result = _glob_files(pattern, str(structured_dir))
+
+        assert sorted(result.content.splitlines()) == expected
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_recursive_skips_symlinked_dirs(
+        self, mutable_structured_dir, check_success
+    ):
+        """** does not descend into symlinked directories (no cycles)."""
+        (mutable_structured_dir / "src" / "loop").symlink_to(mutable_structured_dir)
+
+        result = _glob_files("**/*.md", str(mutable_structured_dir))
+
+        check_success(result)
+        assert sorted(result.content.splitlines()) == ["README.md", "docs/guide.md"]
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_absolute_pattern_fails(self, structured_dir, check_failure):
+        """Absolute patterns are rejected like Path.glob does."""
+        result = _glob_files("/etc/*", str(structured_dir))
+
+        check_failure(result, "搜索文件失败")
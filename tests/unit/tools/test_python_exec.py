@@ -12,12 +12,21 @@ Test cases based on boundary testing plan:
 - P09: Syntax error
 - P10: Runtime error (ZeroDivisionError)
 - P11: Built-in functions
+- P12: Timeout (runaway code)
+- P13: CPU time limit
+- P14: Memory limit
 """
 
+import threading
+import time
+
 import pytest
 
+from funnel_canary.tools.categories import compute
 from funnel_canary.tools.categories.compute import _python_exec
 
+COMPUTE = "funnel_canary.tools.categories.compute"
+
 
 class TestPythonExecAllowedOperations:
     """Test cases for allowed Python operations."""
@@ -203,6 +212,22 @@ class TestPythonExecAllowedOperations:
         assert "[0, 1, 4, 9, 16]" in result.content
 
 
+class TestPythonExecImports:
+    """Test cases for whitelisted module imports."""
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_import_allowed_modules(self, check_success):
+        """Whitelisted modules can be imported explicitly."""
+        result = _python_exec(
+            'import math\nimport re\nfrom json import dumps\n'
+            'print(math.floor(2.5), re.sub("a", "b", "aa"), dumps([1]))'
+        )
+
+        check_success(result)
+        assert result.content == "2 bb [1]"
+
+
 class TestPythonExecForbiddenOperations:
     """Test cases for forbidden Python operations."""
 
@@ -218,6 +243,14 @@ class TestPythonExecForbiddenOperations:
 
         check_failure(result)
 
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_import_error_reported(self, check_failure):
+        """Forbidden imports fail with ImportError."""
+        result = _python_exec('from os import path')
+
+        check_failure(result, "ImportError")
+
     @pytest.mark.unit
     @pytest.mark.tools
     def test_import_subprocess_forbidden(self, check_failure):
@@ -350,6 +383,69 @@ class TestPythonExecErrors:
 
         check_failure(result, "KeyError")
 
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_infinite_loop_times_out(self, check_failure, monkeypatch):
+        """Runaway code is stopped and the next call still works."""
+        monkeypatch.setattr(
+            "funnel_canary.tools.categories.compute.PYTHON_EXEC_TIMEOUT", 1
+        )
+
+        result = _python_exec('while True:\n    pass')
+
+        check_failure(result, "执行超时")
+        assert _python_exec('print("recovered")').content == "recovered"
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_timeout_spares_concurrent_calls(self, check_success, monkeypatch):
+        """A timed-out call only kills its own worker."""
+        monkeypatch.setattr(f"{COMPUTE}.PYTHON_EXEC_TIMEOUT", 3)
+        monkeypatch.setattr(f"{COMPUTE}.PYTHON_EXEC_CPU_LIMIT", 10)
+        results = {}
+        runaway = threading.Thread(
+            target=lambda: results.setdefault(
+                "runaway", _python_exec('while True:\n    pass')
+            )
+        )
+        runaway.start()
+        time.sleep(1)
+
+        result = _python_exec('print("ok")')
+        runaway.join()
+
+        check_success(result)
+        assert result.content == "ok"
+        assert "执行超时" in results["runaway"].error_message
+
+    # =========================================================================
+    # P13-P14: Resource limits
+    # =========================================================================
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    @pytest.mark.skipif(compute.resource is None, reason="resource module unavailable")
+    def test_cpu_limit_reported(self, check_failure, monkeypatch):
+        """P13: A worker killed by RLIMIT_CPU reports the CPU limit, not a timeout."""
+        monkeypatch.setattr(f"{COMPUTE}.PYTHON_EXEC_TIMEOUT", 10)
+        monkeypatch.setattr(f"{COMPUTE}.PYTHON_EXEC_CPU_LIMIT", 1)
+
+        started = time.monotonic()
+        result = _python_exec('while True:\n    pass')
+
+        check_failure(result, "超出CPU时间限制")
+        assert time.monotonic() - started < 10
+        assert _python_exec('print("recovered")').content == "recovered"
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    @pytest.mark.skipif(compute.resource is None, reason="resource module unavailable")
+    def test_memory_limit_reported(self, check_failure):
+        """P14: Exceeding RLIMIT_AS reports the memory limit."""
+        result = _python_exec('x = "x" * 10**10')
+
+        check_failure(result, "超出内存限制")
+
 
 class TestPythonExecMetadata:
     """Test cases for metadata and observation."""
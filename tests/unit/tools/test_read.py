@@ -12,6 +12,10 @@ Test cases based on boundary testing plan:
 - R09: Empty path
 """
 
+import os
+import time
+from unittest.mock import patch
+
 import pytest
 
 from funnel_canary.tools.categories.filesystem import _read_file, FILE_READ_MAX
@@ -190,3 +194,79 @@ class TestReadTool:
 
         assert result.observation.source_type == ObservationType.TOOL_RETURN
         assert result.observation.source_id == "Read"
+
+
+class TestReadDecoding:
+    """Test cases for single-pass file decoding."""
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_invalid_utf8_replaced_in_text(self, temp_dir, check_success):
+        """Invalid bytes are replaced while valid text is kept."""
+        path = temp_dir / "mixed.txt"
+        path.write_bytes("中文 ok ".encode("utf-8") + b"\xff\xfe end")
+
+        result = _read_file(str(path))
+
+        check_success(result)
+        assert result.content == "中文 ok \ufffd\ufffd end"
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_newlines_normalized(self, temp_dir):
+        """CRLF and CR line endings are read as LF."""
+        path = temp_dir / "windows.txt"
+        path.write_bytes(b"one\r\ntwo\rthree\n")
+
+        result = _read_file(str(path))
+
+        assert result.content == "one\ntwo\nthree\n"
+
+
+class TestReadCache:
+    """Test cases for the Read file-content cache."""
+
+    @staticmethod
+    def _age(path, seconds=60):
+        """Backdate a file so it is old enough to be cached."""
+        past = time.time() - seconds
+        os.utime(path, (past, past))
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_unchanged_file_served_from_cache(self, sample_file, check_success):
+        """A second read of an unchanged file does not touch the disk."""
+        self._age(sample_file)
+        first = _read_file(str(sample_file))
+
+        with patch("pathlib.Path.read_bytes") as read_bytes:
+            second = _read_file(str(sample_file))
+
+        read_bytes.assert_not_called()
+        check_success(second)
+        assert second.content == first.content
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_modified_file_reread(self, sample_file):
+        """Changing a file invalidates its cached content."""
+        self._age(sample_file, 120)
+        _read_file(str(sample_file))
+
+        sample_file.write_text("Changed content")
+        self._age(sample_file, 60)
+        result = _read_file(str(sample_file))
+
+        assert result.content == "Changed content"
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_recently_modified_file_not_cached(self, sample_file):
+        """Files modified within the last second are always re-read."""
+        _read_file(str(sample_file))
+
+        with patch("pathlib.Path.read_bytes", return_value=b"fresh") as read_bytes:
+            result = _read_file(str(sample_file))
+
+        read_bytes.assert_called_once()
+        assert result.content == "fresh"
@@ -11,12 +11,22 @@ Test cases based on boundary testing plan:
 - U08: TTL verification
 """
 
-from unittest.mock import MagicMock, patch
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
-from funnel_canary.tools.categories.web import _read_url, WEB_PAGE_TTL
+from funnel_canary.tools.categories import web
+from funnel_canary.tools.categories.web import (
+    _read_url,
+    _read_urls,
+    extract_text_from_html,
+    read_url_many,
+    read_urls,
+    READ_URLS_MAX_COUNT,
+    WEB_PAGE_TTL,
+)
 
 
 class TestReadUrlSuccess:
@@ -42,15 +52,15 @@ class TestReadUrlSuccess:
         </html>
         '''
 
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_response = MagicMock()
-            mock_response.text = html_response
+            mock_response.iter_bytes.return_value = [html_response.encode()]
+            mock_response.encoding = "utf-8"
             mock_response.raise_for_status = MagicMock()
 
             mock_instance = MagicMock()
-            mock_instance.get.return_value = mock_response
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_instance.stream.return_value.__enter__.return_value = mock_response
+            mock_get_client.return_value = mock_instance
 
             result = _read_url("https://example.com")
 
@@ -73,15 +83,15 @@ class TestReadUrlSuccess:
         </body></html>
         '''
 
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_response = MagicMock()
-            mock_response.text = html_response
+            mock_response.iter_bytes.return_value = [html_response.encode()]
+            mock_response.encoding = "utf-8"
             mock_response.raise_for_status = MagicMock()
 
             mock_instance = MagicMock()
-            mock_instance.get.return_value = mock_response
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_instance.stream.return_value.__enter__.return_value = mock_response
+            mock_get_client.return_value = mock_instance
 
             result = _read_url("https://example.com")
 
@@ -102,15 +112,15 @@ class TestReadUrlSuccess:
         long_text = "A" * 5000
         html_response = f'<html><body><p>{long_text}</p></body></html>'
 
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_response = MagicMock()
-            mock_response.text = html_response
+            mock_response.iter_bytes.return_value = [html_response.encode()]
+            mock_response.encoding = "utf-8"
             mock_response.raise_for_status = MagicMock()
 
             mock_instance = MagicMock()
-            mock_instance.get.return_value = mock_response
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_instance.stream.return_value.__enter__.return_value = mock_response
+            mock_get_client.return_value = mock_instance
 
             result = _read_url("https://example.com")
 
@@ -128,21 +138,71 @@ class TestReadUrlSuccess:
         text = "A" * 4000
         html_response = f'<html><body><p>{text}</p></body></html>'
 
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_response = MagicMock()
-            mock_response.text = html_response
+            mock_response.iter_bytes.return_value = [html_response.encode()]
+            mock_response.encoding = "utf-8"
             mock_response.raise_for_status = MagicMock()
 
             mock_instance = MagicMock()
-            mock_instance.get.return_value = mock_response
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_instance.stream.return_value.__enter__.return_value = mock_response
+            mock_get_client.return_value = mock_instance
 
             result = _read_url("https://example.com")
 
             check_success(result)
             assert result.observation.metadata.get("truncated", False) is False
 
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_many_paragraphs_truncated(self, check_success):
+        """Pages with many short text runs are still truncated correctly."""
+        html_response = "<html><body>" + "<p>word</p>" * 5000 + "</body></html>"
+
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
+            mock_response = MagicMock()
+            mock_response.iter_bytes.return_value = [html_response.encode()]
+            mock_response.encoding = "utf-8"
+            mock_response.raise_for_status = MagicMock()
+
+            mock_instance = MagicMock()
+            mock_instance.stream.return_value.__enter__.return_value = mock_response
+            mock_get_client.return_value = mock_instance
+
+            result = _read_url("https://example.com")
+
+            check_success(result)
+            assert result.observation.metadata["truncated"] is True
+            assert result.content.startswith("word word")
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_download_stops_at_byte_cap(self, check_success, monkeypatch):
+        """Pages larger than PAGE_MAX_BYTES are not read to the end."""
+        monkeypatch.setattr("funnel_canary.tools.categories.web.PAGE_MAX_BYTES", 64)
+        chunks_read = []
+
+        def iter_bytes():
+            for i in range(100):
+                chunks_read.append(i)
+                yield f"<p>chunk {i:02d}</p>".encode()
+
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
+            mock_response = MagicMock()
+            mock_response.iter_bytes = iter_bytes
+            mock_response.encoding = "utf-8"
+            mock_response.raise_for_status = MagicMock()
+
+            mock_instance = MagicMock()
+            mock_instance.stream.return_value.__enter__.return_value = mock_response
+            mock_get_client.return_value = mock_instance
+
+            result = _read_url("https://example.com/huge")
+
+            check_success(result)
+            assert result.content.startswith("chunk 00 chunk 01")
+            assert len(chunks_read) < 10
+
     # =========================================================================
     # U03: Empty page (low confidence)
     # =========================================================================
@@ -153,15 +213,15 @@ class TestReadUrlSuccess:
         """U03: Empty page returns low confidence."""
         html_response = '<html><body><script>only script</script></body></html>'
 
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_response = MagicMock()
-            mock_response.text = html_response
+            mock_response.iter_bytes.return_value = [html_response.encode()]
+            mock_response.encoding = "utf-8"
             mock_response.raise_for_status = MagicMock()
 
             mock_instance = MagicMock()
-            mock_instance.get.return_value = mock_response
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_instance.stream.return_value.__enter__.return_value = mock_response
+            mock_get_client.return_value = mock_instance
 
             result = _read_url("https://example.com")
 
@@ -180,15 +240,15 @@ class TestReadUrlSuccess:
         """U08: Verify TTL is set correctly."""
         html_response = '<html><body><p>Test content</p></body></html>'
 
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_response = MagicMock()
-            mock_response.text = html_response
+            mock_response.iter_bytes.return_value = [html_response.encode()]
+            mock_response.encoding = "utf-8"
             mock_response.raise_for_status = MagicMock()
 
             mock_instance = MagicMock()
-            mock_instance.get.return_value = mock_response
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_instance.stream.return_value.__enter__.return_value = mock_response
+            mock_get_client.return_value = mock_instance
 
             result = _read_url("https://example.com")
 
@@ -207,7 +267,7 @@ class TestReadUrlErrors:
     @pytest.mark.tools
     def test_http_404_error(self, check_failure):
         """U04: Handle 404 Not Found error."""
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_response = MagicMock()
             mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
                 "Not Found",
@@ -216,9 +276,8 @@ class TestReadUrlErrors:
             )
 
             mock_instance = MagicMock()
-            mock_instance.get.return_value = mock_response
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_instance.stream.return_value.__enter__.return_value = mock_response
+            mock_get_client.return_value = mock_instance
 
             result = _read_url("https://example.com/notfound")
 
@@ -228,7 +287,7 @@ class TestReadUrlErrors:
     @pytest.mark.tools
     def test_http_500_error(self, check_failure):
         """Handle 500 Internal Server Error."""
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_response = MagicMock()
             mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
                 "Server Error",
@@ -237,9 +296,8 @@ class TestReadUrlErrors:
             )
 
             mock_instance = MagicMock()
-            mock_instance.get.return_value = mock_response
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_instance.stream.return_value.__enter__.return_value = mock_response
+            mock_get_client.return_value = mock_instance
 
             result = _read_url("https://example.com")
 
@@ -253,11 +311,10 @@ class TestReadUrlErrors:
     @pytest.mark.tools
     def test_ssl_error(self, check_failure):
         """U05: Handle SSL certificate errors."""
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_instance = MagicMock()
-            mock_instance.get.side_effect = httpx.HTTPError("SSL certificate error")
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_instance.stream.side_effect = httpx.HTTPError("SSL certificate error")
+            mock_get_client.return_value = mock_instance
 
             result = _read_url("https://example.com")
 
@@ -271,11 +328,10 @@ class TestReadUrlErrors:
     @pytest.mark.tools
     def test_timeout_error(self, check_failure):
         """U06: Handle timeout errors."""
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_instance = MagicMock()
-            mock_instance.get.side_effect = httpx.TimeoutException("Request timed out")
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_instance.stream.side_effect = httpx.TimeoutException("Request timed out")
+            mock_get_client.return_value = mock_instance
 
             result = _read_url("https://example.com")
 
@@ -292,15 +348,15 @@ class TestReadUrlErrors:
         # Note: httpx with follow_redirects=True handles this internally
         html_response = '<html><body><p>Final destination</p></body></html>'
 
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_response = MagicMock()
-            mock_response.text = html_response
+            mock_response.iter_bytes.return_value = [html_response.encode()]
+            mock_response.encoding = "utf-8"
             mock_response.raise_for_status = MagicMock()
 
             mock_instance = MagicMock()
-            mock_instance.get.return_value = mock_response
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_instance.stream.return_value.__enter__.return_value = mock_response
+            mock_get_client.return_value = mock_instance
 
             result = _read_url("https://example.com/redirect")
 
@@ -317,15 +373,15 @@ class TestReadUrlMetadata:
         """Verify observation source is correctly set."""
         html_response = '<html><body><p>Test</p></body></html>'
 
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_response = MagicMock()
-            mock_response.text = html_response
+            mock_response.iter_bytes.return_value = [html_response.encode()]
+            mock_response.encoding = "utf-8"
             mock_response.raise_for_status = MagicMock()
 
             mock_instance = MagicMock()
-            mock_instance.get.return_value = mock_response
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_instance.stream.return_value.__enter__.return_value = mock_response
+            mock_get_client.return_value = mock_instance
 
             result = _read_url("https://example.com")
 
@@ -340,15 +396,15 @@ class TestReadUrlMetadata:
         """Verify metadata contains the URL."""
         html_response = '<html><body><p>Test</p></body></html>'
 
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_response = MagicMock()
-            mock_response.text = html_response
+            mock_response.iter_bytes.return_value = [html_response.encode()]
+            mock_response.encoding = "utf-8"
             mock_response.raise_for_status = MagicMock()
 
             mock_instance = MagicMock()
-            mock_instance.get.return_value = mock_response
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_instance.stream.return_value.__enter__.return_value = mock_response
+            mock_get_client.return_value = mock_instance
 
             result = _read_url("https://test.example.com/page")
 
@@ -360,15 +416,15 @@ class TestReadUrlMetadata:
         """Verify metadata contains content length."""
         html_response = '<html><body><p>Some text here</p></body></html>'
 
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_response = MagicMock()
-            mock_response.text = html_response
+            mock_response.iter_bytes.return_value = [html_response.encode()]
+            mock_response.encoding = "utf-8"
             mock_response.raise_for_status = MagicMock()
 
             mock_instance = MagicMock()
-            mock_instance.get.return_value = mock_response
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_instance.stream.return_value.__enter__.return_value = mock_response
+            mock_get_client.return_value = mock_instance
 
             result = _read_url("https://example.com")
 
@@ -381,15 +437,15 @@ class TestReadUrlMetadata:
         """Verify observation scope contains URL."""
         html_response = '<html><body><p>Test</p></body></html>'
 
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_response = MagicMock()
-            mock_response.text = html_response
+            mock_response.iter_bytes.return_value = [html_response.encode()]
+            mock_response.encoding = "utf-8"
             mock_response.raise_for_status = MagicMock()
 
             mock_instance = MagicMock()
-            mock_instance.get.return_value = mock_response
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_instance.stream.return_value.__enter__.return_value = mock_response
+            mock_get_client.return_value = mock_instance
 
             result = _read_url("https://example.com/test")
 
@@ -402,16 +458,212 @@ class TestReadUrlMetadata:
         """Verify confidence for successful extraction."""
         html_response = '<html><body><p>Content here</p></body></html>'
 
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_response = MagicMock()
-            mock_response.text = html_response
+            mock_response.iter_bytes.return_value = [html_response.encode()]
+            mock_response.encoding = "utf-8"
             mock_response.raise_for_status = MagicMock()
 
             mock_instance = MagicMock()
-            mock_instance.get.return_value = mock_response
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_instance.stream.return_value.__enter__.return_value = mock_response
+            mock_get_client.return_value = mock_instance
 
             result = _read_url("https://example.com")
 
             assert result.observation.confidence == 1.0
+
+
+class TestReadUrlCache:
+    """Test cases for cached page revalidation."""
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_expired_page_revalidated_with_etag(self, check_success, monkeypatch):
+        """An expired page is reused when the server answers 304."""
+        from funnel_canary.tools.categories import web
+
+        monkeypatch.setattr(web._page_cache, "ttl", 0)
+
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
+            first_response = MagicMock()
+            first_response.status_code = 200
+            first_response.headers = httpx.Headers({"ETag": '"v1"'})
+            first_response.iter_bytes.return_value = [b"<p>Original page</p>"]
+            first_response.encoding = "utf-8"
+
+            not_modified = MagicMock()
+            not_modified.status_code = 304
+
+            mock_instance = MagicMock()
+            mock_instance.stream.return_value.__enter__.side_effect = [
+                first_response,
+                not_modified,
+            ]
+            mock_get_client.return_value = mock_instance
+
+            first = _read_url("https://example.com/page")
+            second = _read_url("https://example.com/page")
+
+            check_success(second)
+            assert second.content == first.content == "Original page"
+            assert mock_instance.stream.call_args.kwargs["headers"] == {
+                "If-None-Match": '"v1"'
+            }
+            not_modified.iter_bytes.assert_not_called()
+
+
+class TestReadUrlMany:
+    """Test cases for concurrent batch URL reading."""
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_results_in_input_order(self, check_success, check_failure):
+        """Each URL gets its own result, in the order given."""
+        pages = [
+            ("<html><body><p>First page</p></body></html>", {}),
+            httpx.ConnectError("Connection refused"),
+            ("<html><body><p>Third page</p></body></html>", {}),
+        ]
+
+        with patch(
+            "funnel_canary.tools.categories.web._fetch_pages",
+            new=AsyncMock(return_value=pages),
+        ):
+            results = read_url_many([
+                "https://one.example.com",
+                "https://two.example.com",
+                "https://three.example.com",
+            ])
+
+        check_success(results[0])
+        assert "First page" in results[0].content
+        check_failure(results[1], "读取URL失败")
+        check_success(results[2])
+        assert results[2].observation.metadata["url"] == "https://three.example.com"
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_duplicate_and_cached_urls_fetched_once(self):
+        """Cached URLs are not refetched and duplicates are fetched once."""
+        html_response = "<html><body><p>Cached page</p></body></html>"
+
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
+            mock_response = MagicMock()
+            mock_response.iter_bytes.return_value = [html_response.encode()]
+            mock_response.encoding = "utf-8"
+            mock_response.raise_for_status = MagicMock()
+
+            mock_instance = MagicMock()
+            mock_instance.stream.return_value.__enter__.return_value = mock_response
+            mock_get_client.return_value = mock_instance
+
+            _read_url("https://cached.example.com")
+
+        fetch_pages = AsyncMock(return_value=[("<p>New page</p>", {})])
+        with patch("funnel_canary.tools.categories.web._fetch_pages", new=fetch_pages):
+            results = read_url_many([
+                "https://cached.example.com",
+                "https://new.example.com",
+                "https://new.example.com",
+            ])
+
+        fetch_pages.assert_awaited_once_with(["https://new.example.com"])
+        assert "Cached page" in results[0].content
+        assert results[1].content == results[2].content == "New page"
+
+
+class TestReadUrls:
+    """Test cases for the read_urls batch tool."""
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_sections_per_url(self, check_success):
+        """Each URL gets a numbered section; failures don't fail the call."""
+        pages = [
+            ("<html><body><p>First page</p></body></html>", {}),
+            httpx.ConnectError("Connection refused"),
+        ]
+
+        with patch(
+            "funnel_canary.tools.categories.web._fetch_pages",
+            new=AsyncMock(return_value=pages),
+        ):
+            result = _read_urls(["https://one.example.com", "https://two.example.com"])
+
+        check_success(result)
+        assert "[1] https://one.example.com\nFirst page" in result.content
+        assert "[2] https://two.example.com\n读取URL失败" in result.content
+        assert result.observation.metadata["failed_urls"] == ["https://two.example.com"]
+        assert result.observation.ttl_seconds == WEB_PAGE_TTL
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_all_failed(self, check_failure):
+        """The call fails when no page could be read."""
+        with patch(
+            "funnel_canary.tools.categories.web._fetch_pages",
+            new=AsyncMock(return_value=[httpx.ConnectError("Connection refused")]),
+        ):
+            result = _read_urls(["https://down.example.com"])
+
+        check_failure(result, "读取URL失败")
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    @pytest.mark.parametrize("count", [0, READ_URLS_MAX_COUNT + 1])
+    def test_url_count_validated(self, check_failure, count):
+        """Empty and oversized URL lists are rejected without fetching."""
+        fetch_pages = AsyncMock()
+        with patch("funnel_canary.tools.categories.web._fetch_pages", new=fetch_pages):
+            result = _read_urls([f"https://{i}.example.com" for i in range(count)])
+
+        check_failure(result, "URL")
+        fetch_pages.assert_not_awaited()
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_schema_declares_string_array(self):
+        """The urls parameter is an array of strings in the OpenAI schema."""
+        schema = read_urls.to_openai_schema()["function"]["parameters"]
+
+        assert schema["properties"]["urls"]["type"] == "array"
+        assert schema["properties"]["urls"]["items"] == {"type": "string"}
+        assert schema["required"] == ["urls"]
+
+
+class TestExtractTextMalformedHtml:
+    """Guard text extraction against super-linear behaviour on bad HTML."""
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    @pytest.mark.parametrize("html", [
+        "<" * 10_000,
+        "<a" * 10_000,
+        '<a "' * 5_000,
+        "<!-" * 7_000,
+        "<script" * 3_000,
+    ])
+    def test_pathological_input_is_linear(self, html):
+        """Unterminated tags, comments and scripts are handled in linear time."""
+        start = time.perf_counter()
+        extract_text_from_html(html)
+        elapsed = time.perf_counter() - start
+
+        # Quadratic tokenizing takes seconds on these inputs
+        assert elapsed < 0.5
+
+
+class TestExtractTextTokenizer:
+    """Edge cases where HTML tokenizers disagree."""
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    @pytest.mark.parametrize("html,expected", [
+        ("<noscript>ns</noscript><p>ok</p>", "ok"),
+        ("<textarea><b>kept</b></textarea>", "kept"),
+        ("x<y and a &amp; b", "x<y and a & b"),
+        ("<script>var a = 1;</script><style>p {}</style>text<!-- note -->", "text"),
+    ])
+    def test_tokenizer_edge_cases(self, html, expected):
+        """noscript is dropped, textarea tags are stripped, bare '<' is kept."""
+        assert extract_text_from_html(html) == expected
@@ -9,12 +9,20 @@ Test cases based on boundary testing plan:
 - W06: TTL verification
 """
 
+import time
 from unittest.mock import MagicMock, patch
 
 import httpx
 import pytest
 
-from funnel_canary.tools.categories.web import _web_search, WEB_SEARCH_TTL
+from funnel_canary.tools.categories import web
+from funnel_canary.tools.categories.web import (
+    _TAG_RE,
+    _parse_search_results,
+    _scan_search_results,
+    _web_search,
+    WEB_SEARCH_TTL,
+)
 
 
 class TestWebSearchSuccess:
@@ -43,15 +51,14 @@ class TestWebSearchSuccess:
         </body></html>
         '''
 
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_response = MagicMock()
             mock_response.text = html_response
             mock_response.raise_for_status = MagicMock()
 
             mock_instance = MagicMock()
             mock_instance.post.return_value = mock_response
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_get_client.return_value = mock_instance
 
             result = _web_search("python tutorial")
 
@@ -60,6 +67,33 @@ class TestWebSearchSuccess:
             assert result.observation.metadata["query"] == "python tutorial"
             assert result.observation.metadata["result_count"] >= 1
 
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_inline_tags_and_entities_cleaned(self, check_success):
+        """Inline markup is stripped and entities decoded in result text."""
+        html_response = '''
+        <a class="result__a" href="#">Tom &amp; <b>Jerry</b></a>
+        <a class="result__snippet">A <b>cat</b> &amp; mouse show</a>
+        <a class="result__url">https://example.com/tom</a>
+        '''
+
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
+            mock_response = MagicMock()
+            mock_response.text = html_response
+            mock_response.raise_for_status = MagicMock()
+
+            mock_instance = MagicMock()
+            mock_instance.post.return_value = mock_response
+            mock_get_client.return_value = mock_instance
+
+            result = _web_search("tom and jerry")
+
+            check_success(result)
+            assert "1. Tom & Jerry\n   A cat & mouse show" in result.content
+            assert result.observation.metadata["source_urls"] == [
+                "https://example.com/tom"
+            ]
+
     @pytest.mark.unit
     @pytest.mark.tools
     def test_search_results_numbered(self, check_success):
@@ -75,15 +109,14 @@ class TestWebSearchSuccess:
         </body></html>
         '''
 
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_response = MagicMock()
             mock_response.text = html_response
             mock_response.raise_for_status = MagicMock()
 
             mock_instance = MagicMock()
             mock_instance.post.return_value = mock_response
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_get_client.return_value = mock_instance
 
             result = _web_search("test query")
 
@@ -109,15 +142,14 @@ class TestWebSearchSuccess:
 
         html_response = f"<html><body>{results_html}</body></html>"
 
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_response = MagicMock()
             mock_response.text = html_response
             mock_response.raise_for_status = MagicMock()
 
             mock_instance = MagicMock()
             mock_instance.post.return_value = mock_response
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_get_client.return_value = mock_instance
 
             result = _web_search("many results")
 
@@ -135,15 +167,14 @@ class TestWebSearchSuccess:
         """W03: Handle case when no results found."""
         html_response = "<html><body><div>No results found</div></body></html>"
 
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_response = MagicMock()
             mock_response.text = html_response
             mock_response.raise_for_status = MagicMock()
 
             mock_instance = MagicMock()
             mock_instance.post.return_value = mock_response
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_get_client.return_value = mock_instance
 
             result = _web_search("xyznonexistent123456")
 
@@ -168,15 +199,14 @@ class TestWebSearchSuccess:
         </body></html>
         '''
 
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_response = MagicMock()
             mock_response.text = html_response
             mock_response.raise_for_status = MagicMock()
 
             mock_instance = MagicMock()
             mock_instance.post.return_value = mock_response
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_get_client.return_value = mock_instance
 
             result = _web_search("test")
 
@@ -195,11 +225,10 @@ class TestWebSearchErrors:
     @pytest.mark.tools
     def test_network_error(self, check_failure):
         """W04: Handle network errors gracefully."""
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_instance = MagicMock()
             mock_instance.post.side_effect = httpx.HTTPError("Connection failed")
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_get_client.return_value = mock_instance
 
             result = _web_search("test query")
 
@@ -209,7 +238,7 @@ class TestWebSearchErrors:
     @pytest.mark.tools
     def test_http_error_status(self, check_failure):
         """Handle HTTP error status codes."""
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_response = MagicMock()
             mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
                 "Server error",
@@ -219,8 +248,7 @@ class TestWebSearchErrors:
 
             mock_instance = MagicMock()
             mock_instance.post.return_value = mock_response
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_get_client.return_value = mock_instance
 
             result = _web_search("test query")
 
@@ -234,11 +262,10 @@ class TestWebSearchErrors:
     @pytest.mark.tools
     def test_timeout_error(self, check_failure):
         """W05: Handle timeout errors."""
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_instance = MagicMock()
             mock_instance.post.side_effect = httpx.TimeoutException("Request timed out")
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_get_client.return_value = mock_instance
 
             result = _web_search("test query")
 
@@ -259,15 +286,14 @@ class TestWebSearchMetadata:
         </body></html>
         '''
 
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_response = MagicMock()
             mock_response.text = html_response
             mock_response.raise_for_status = MagicMock()
 
             mock_instance = MagicMock()
             mock_instance.post.return_value = mock_response
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_get_client.return_value = mock_instance
 
             result = _web_search("test")
 
@@ -282,15 +308,14 @@ class TestWebSearchMetadata:
         """Verify metadata contains the query."""
         html_response = '<html><body></body></html>'
 
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_response = MagicMock()
             mock_response.text = html_response
             mock_response.raise_for_status = MagicMock()
 
             mock_instance = MagicMock()
             mock_instance.post.return_value = mock_response
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_get_client.return_value = mock_instance
 
             result = _web_search("my test query")
 
@@ -302,15 +327,14 @@ class TestWebSearchMetadata:
         """Verify metadata contains a timestamp."""
         html_response = '<html><body></body></html>'
 
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_response = MagicMock()
             mock_response.text = html_response
             mock_response.raise_for_status = MagicMock()
 
             mock_instance = MagicMock()
             mock_instance.post.return_value = mock_response
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_get_client.return_value = mock_instance
 
             result = _web_search("test")
 
@@ -322,17 +346,162 @@ class TestWebSearchMetadata:
         """Verify observation scope contains query."""
         html_response = '<html><body></body></html>'
 
-        with patch("httpx.Client") as mock_client:
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
             mock_response = MagicMock()
             mock_response.text = html_response
             mock_response.raise_for_status = MagicMock()
 
             mock_instance = MagicMock()
             mock_instance.post.return_value = mock_response
-            mock_client.return_value.__enter__ = MagicMock(return_value=mock_instance)
-            mock_client.return_value.__exit__ = MagicMock(return_value=False)
+            mock_get_client.return_value = mock_instance
 
             result = _web_search("test query")
 
             assert "search:" in result.observation.scope
             assert "test query" in result.observation.scope
+
+
+class TestWebSearchCache:
+    """Test cases for the web search result cache."""
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_repeated_query_served_from_cache(self):
+        """A repeated query reuses the result without another request."""
+        html_response = '''
+        <html><body>
+        <a class="result__a">Cached Result</a>
+        <a class="result__snippet">Cached snippet</a>
+        </body></html>
+        '''
+
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
+            mock_response = MagicMock()
+            mock_response.text = html_response
+            mock_response.raise_for_status = MagicMock()
+
+            mock_instance = MagicMock()
+            mock_instance.post.return_value = mock_response
+            mock_get_client.return_value = mock_instance
+
+            first = _web_search("cached query")
+            second = _web_search("cached query")
+
+            assert mock_instance.post.call_count == 1
+            assert second.content == first.content
+            assert second.observation.id != first.observation.id
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_query_variants_keep_own_scope(self):
+        """Queries differing in case or whitespace record their own provenance."""
+        html_response = '''
+        <a class="result__a">Cached Result</a>
+        <a class="result__snippet">Cached snippet</a>
+        '''
+
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
+            mock_response = MagicMock()
+            mock_response.text = html_response
+            mock_response.raise_for_status = MagicMock()
+
+            mock_instance = MagicMock()
+            mock_instance.post.return_value = mock_response
+            mock_get_client.return_value = mock_instance
+
+            first = _web_search("Python  Tutorial")
+            second = _web_search("python tutorial")
+
+            assert first.observation.scope == "search:Python  Tutorial"
+            assert second.observation.scope == "search:python tutorial"
+            assert second.observation.metadata["query"] == "python tutorial"
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_errors_not_cached(self, check_failure):
+        """Failed searches are retried on the next call."""
+        with patch("funnel_canary.tools.categories.web._get_client") as mock_get_client:
+            mock_instance = MagicMock()
+            mock_instance.post.side_effect = httpx.HTTPError("Connection failed")
+            mock_get_client.return_value = mock_instance
+
+            check_failure(_web_search("flaky query"))
+            check_failure(_web_search("flaky query"))
+
+            assert mock_instance.post.call_count == 2
+
+
+_RESULTS_PAGE = """
+<div class="result">
+    <a class="result__a" href="#">Tom &amp; <b>Jerry</b></a>
+    <a class="result__snippet">A <b>cat</b> &amp; mouse show</a>
+    <a class="result__url"> https://example.com/tom </a>
+</div>
+""" + "".join(
+    f"""
+<div class="result">
+    <a class="result__a" href="#">Result {i}</a>
+    <a class="result__snippet">Snippet {i}</a>
+    <a class="result__url">https://example.com/{i}</a>
+</div>
+"""
+    for i in range(6)
+)
+
+
+@pytest.fixture(params=["selectolax", "fallback"])
+def search_parser_backend(request, monkeypatch):
+    """Run a test against both result parsers."""
+    if request.param == "selectolax":
+        if web.LexborHTMLParser is None:
+            pytest.skip("selectolax not installed")
+    else:
+        monkeypatch.setattr(web, "LexborHTMLParser", None)
+    return request.param
+
+
+class TestParseSearchResults:
+    """Both result parsers must produce the same fields."""
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_fields_cleaned_and_limited(self, search_parser_backend):
+        """Tags are stripped, entities decoded and each field capped."""
+        titles, snippets, urls = _parse_search_results(_RESULTS_PAGE, limit=5)
+
+        assert titles == ["Tom & Jerry"] + [f"Result {i}" for i in range(4)]
+        assert snippets == ["A cat & mouse show"] + [f"Snippet {i}" for i in range(4)]
+        assert urls == ["https://example.com/tom"] + [
+            f"https://example.com/{i}" for i in range(4)
+        ]
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    def test_no_results(self, search_parser_backend):
+        """Pages without result markup give empty fields."""
+        assert _parse_search_results("<html><body>nothing</body></html>") == (
+            [], [], []
+        )
+
+
+class TestWebSearchMalformedHtml:
+    """Guard result extraction against super-linear behaviour on bad HTML."""
+
+    @pytest.mark.unit
+    @pytest.mark.tools
+    @pytest.mark.parametrize("html", [
+        "<" * 10_000,
+        "<a" * 10_000,
+        'class="result__snippet">' * 2_000,
+        '<a class="result__a">' + "<b" * 10_000,
+    ])
+    def test_pathological_input_is_linear(self, html):
+        """Unterminated tags and markers are handled in linear time."""
+        start = time.perf_counter()
+        titles, snippets, urls = _scan_search_results(html)
+        for value in titles + snippets + urls + [html]:
+            _TAG_RE.sub("", value)
+        elapsed = time.perf_counter() - start
+
+        # Quadratic scanning takes seconds on these inputs
+        assert elapsed < 0.5